@@ -0,0 +1,67 @@
+import numpy as np
+from ctypes import *
+from Master import *
+from Navigation import *
+from Sensor import *
+from Vision import *
+
+# cache of structured dtypes already built, keyed by ctype
+_dtypes = {}
+
+# builds the numpy structured dtype matching a ctype's memory layout
+# offsets and itemsize come from ctypes itself, so padding and unions
+# (overlapping fields at the same offset) line up byte for byte
+def ToDtype(ctype):
+    dtype = _dtypes.get(ctype)
+    if dtype is not None:
+        return dtype
+
+    if issubclass(ctype, Array):
+        dtype = np.dtype((ToDtype(ctype._type_), (ctype._length_,)))
+    elif issubclass(ctype, (Structure, Union)):
+        names = []
+        formats = []
+        offsets = []
+        for field in ctype._fields_:
+            name, fieldType = field[0], field[1]
+            names.append(name)
+            formats.append(ToDtype(fieldType))
+            offsets.append(getattr(ctype, name).offset)
+        dtype = np.dtype({'names': names, 'formats': formats,
+                          'offsets': offsets, 'itemsize': sizeof(ctype)})
+    else:
+        dtype = np.dtype(ctype)
+
+    _dtypes[ctype] = dtype
+    return dtype
+
+# views a string (or a ctype instance) as a single record without copying
+# fields are indexed by name, e.g. View(Linear, string)['pos']
+def View(ctype, string):
+    return np.frombuffer(string, ToDtype(ctype), count = 1)[0]
+
+# views a string holding back to back instances of ctype as a record array
+def ViewArray(ctype, string):
+    return np.frombuffer(string, ToDtype(ctype))
+
+# Master
+AXIS_CONTROL_DTYPE          = ToDtype(AxisControl)
+CONTROL_INPUT_DTYPE         = ToDtype(ControlInput)
+GOALS_DTYPE                 = ToDtype(Goals)
+SENSOR_RESET_DTYPE          = ToDtype(SensorReset)
+
+# Navigation
+KILL_DTYPE                  = ToDtype(Kill)
+HEALTH_DTYPE                = ToDtype(Health)
+OUTPUTS_DTYPE               = ToDtype(Outputs)
+PHYSICAL_OUTPUT_DTYPE       = ToDtype(PhysicalOutput)
+
+# Sensor
+LINEAR_DTYPE                = ToDtype(Linear)
+ANGULAR_DTYPE               = ToDtype(Angular)
+DATA_DTYPE                  = ToDtype(Data)
+
+# Vision
+LOCATION_DTYPE              = ToDtype(Location)
+LOCATION_ARRAY_DTYPE        = ToDtype(LocationArray)
+LOCATION_AND_ROTATION_DTYPE = ToDtype(LocationAndRotation)
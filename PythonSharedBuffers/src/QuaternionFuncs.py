@@ -42,3 +42,33 @@ def q_to_axisangle(q):
   theta = acos(w) * 2.0
   return normalize(v), theta
 
+
+'''quaternionBatchFuncs--------------------------------------------------------
+NumPy versions of the above that work on many points/quaternions at once
+----------------------------------------------------------------------------'''
+#Rotation matrix equivalent to qv_mult(q, v), q of shape (4,) gives (3, 3)
+#and an array of quaternions of shape (N, 4) gives (N, 3, 3)
+def q_to_rotmat(q):
+  q = np.asarray(q, dtype = float)
+  w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+  ww, xx, yy, zz = w * w, x * x, y * y, z * z
+  wx, wy, wz = w * x, w * y, w * z
+  xy, xz, yz = x * y, x * z, y * z
+
+  rotmat = np.empty(q.shape[:-1] + (3, 3))
+  rotmat[..., 0, 0] = ww + xx - yy - zz
+  rotmat[..., 0, 1] = 2 * (xy - wz)
+  rotmat[..., 0, 2] = 2 * (xz + wy)
+  rotmat[..., 1, 0] = 2 * (xy + wz)
+  rotmat[..., 1, 1] = ww - xx + yy - zz
+  rotmat[..., 1, 2] = 2 * (yz - wx)
+  rotmat[..., 2, 0] = 2 * (xz - wy)
+  rotmat[..., 2, 1] = 2 * (yz + wx)
+  rotmat[..., 2, 2] = ww - xx - yy + zz
+  return rotmat
+
+#Rotates points v of shape (M, 3) by quaternion q of shape (4,), giving
+#(M, 3), or by quaternions of shape (N, 4), giving (N, M, 3)
+def qv_mult_batch(q, v, out = None):
+  return np.matmul(np.asarray(v, dtype = float), 
+                   np.swapaxes(q_to_rotmat(q), -1, -2), out = out)
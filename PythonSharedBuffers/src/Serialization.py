@@ -4,11 +4,19 @@ from ctypes import *
 def Pack(ctype_instance):
     return string_at(addressof(ctype_instance), sizeof(ctype_instance))
 
-# convert from string to ctype
+# convert from string to ctype, copied straight out of string
 def Unpack(ctype, string):
-    buf = b''
-    for i in string:
-        buf += i.to_bytes(1, 'little')
-    cstring = create_string_buffer(buf)
-    ctype_instance = cast(pointer(cstring), POINTER(ctype)).contents
+    string = _toBytes(string)
+    if len(string) >= sizeof(ctype):
+        return ctype.from_buffer_copy(string)
+
+    # short payload, copy what is there and leave the rest zeroed
+    ctype_instance = ctype()
+    memmove(addressof(ctype_instance), string, len(string))
     return ctype_instance
+
+# buffer contents may arrive as bytes or as a sequence of ints
+def _toBytes(string):
+    if isinstance(string, bytes):
+        return string
+    return bytes(string)
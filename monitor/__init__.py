@@ -0,0 +1,16 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : __init__.py
+   Description: Shared pieces of the status monitor that do not depend on
+                the figure, so they can be reused by the entry point scripts
+                and imported without starting a GUI.
+---*-----------------------------------------------------------------------*'''
+import os, sys
+
+#Buffer definitions and the pydsm module live in the PythonSharedBuffers and
+#DistributedSharedMemory checkouts next to this one, found from this file so
+#every entry point works from any working directory
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_ROOT, 'DistributedSharedMemory', 'build'))
+sys.path.insert(0, os.path.join(_ROOT, 'PythonSharedBuffers', 'src'))
@@ -0,0 +1,305 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : app.py
+   Description: Command line front end shared by statusmon.py,
+                blitstatusmon.py and demoStatusmon.py. Parses args, builds
+                the buffer table, data source, figure and renderer for the
+                chosen mode, then runs them in a window or headless.
+                Everything past arg parsing is imported only by the modes
+                that use it (pydsm for live/debug, pyplot for a window), so
+                startup does no more work than the chosen mode needs.
+---*-----------------------------------------------------------------------*'''
+import sys, getopt
+from monitor.layout import Layout, parseLayout
+from monitor.startup import StartupTimer
+
+#Arg parse constants
+MODE_LIVE   = 0
+MODE_DEBUG  = 1
+MODE_DEMO   = 2
+MODE_REPLAY = 3
+
+INIT_ZERO  = 0
+INIT_RAND  = 1
+
+MODE_STR = ['Live ', 'Debug', 'Demo ', 'Replay'] #Modes in string form
+INIT_STR = ['Zero', 'Rand']                      #Init states in string form
+
+#Run Constants
+DELAY          = 1000 #Millisecond delay between drawings
+POLL_DELAY     = 100  #Longest millisecond wait between polls, 0 polls per draw
+TIMING_WINDOW  = 100  #Frames kept for rolling frame timing stats
+FETCH_DEADLINE = 50   #Longest millisecond wait on servers per poll
+
+USAGE = 'Usage: python3 {0} [-m] <mode> [-r] [-p] <ms> [-b] '\
+        '[-o] <path> [-f] <fps> [-n] <frames> [-l] <path> [-s] <speed> '\
+        '[-t] <s> [-d] <dir> [-c] <csv> [-i] [-L] <layout> [-w] <ms> '\
+        '[-g] | [-h]\n'\
+        '       python3 {0} -m replay <log> [options]\n'\
+        '  -m   Set Mode         (\'debug\', \'demo\', \'replay\')\n'\
+        '  -r   Random Data Init\n'\
+        '  -p   Max Poll Delay   (ms, 0 to poll once per draw)\n'\
+        '  -b   Blit (only redraw data, not axes)\n'\
+        '  -o   Headless Output  (- or .mjpeg for MJPEG, .png, {{:05d}}.png)\n'\
+        '  -f   Headless FPS\n'\
+        '  -n   Headless Frames  (stop after this many)\n'\
+        '  -l   Record Buffers   (binary log of every poll)\n'\
+        '  -s   Replay Speed     (x real time, 0 for as fast as possible)\n'\
+        '  -t   Replay Start     (s into log)\n'\
+        '  -d   Local DSM        (dir of python3 -m monitor.localdsm)\n'\
+        '  -c   Timing CSV       (per stage ns of every frame)\n'\
+        '  -i   Startup Report   (time and imports of each startup step)\n'\
+        '  -L   Panel Layout     (file or spec, e.g. status,heatmap, see '\
+        'monitor/layout.py)\n'\
+        '  -w   Fetch Deadline   (ms, 0 to fetch servers one at a time)\n'\
+        '  -g   Debug Buffers    (decode and show them, e.g. in replay)\n'\
+        '  -h   Show help'
+
+'''Options---------------------------------------------------------------------
+Settings of one run, defaults overridden by command line args
+----------------------------------------------------------------------------'''
+class Options(object):
+  def __init__(self, blit = False, delay = DELAY):
+    self.mode       = MODE_LIVE   #Default mode is ReadBufferMode
+    self.randInit   = INIT_ZERO   #Default init is 0 init
+    self.pollDelay  = POLL_DELAY  #Default poll delay
+    self.blit       = blit        #Default redraws whole figure
+    self.delay      = delay       #Millisecond delay between drawings
+    self.output     = None        #Default shows figure in a window
+    self.fps        = 1000.0 / delay #Default headless rate matches drawing
+    self.frames     = None        #Default headless run never stops
+    self.logPath    = None        #Default records nothing
+    self.replayPath = None        #Log played back in replay mode
+    self.speed      = 1.0         #Default replays in real time
+    self.seekTime   = 0.0         #Default replays from start of log
+    self.localDir   = None        #Default connects to real DSM servers
+    self.timingPath = None        #Default keeps frame timing only in memory
+    self.report     = False       #Default only prints total startup time
+    self.layout     = None        #Default shows every panel
+    self.deadline   = FETCH_DEADLINE #Default fetches servers concurrently
+    self.debug      = False       #Default skips debug only buffers
+
+'''parseArgs-------------------------------------------------------------------
+Parse command line args into options, exiting on bad args or -h
+----------------------------------------------------------------------------'''
+def parseArgs(argv, options, prog = 'statusmon.py'):
+  usage = USAGE.format(prog)
+
+  try:
+    #Options may follow the replay log, so allow them anywhere
+    opts, args = getopt.gnu_getopt(argv, 'hm:rp:bo:f:n:l:s:t:d:c:iL:w:g')
+  except getopt.GetoptError as err:
+    #Print error message, then print short usage, then exit
+    print(err)
+    print(usage)
+    sys.exit(2)
+
+  for opt, arg in opts:
+    if opt == '-h':        #Print help and exit
+      print(usage)
+      sys.exit()
+    elif opt == '-m':      #Set mode to demo
+      if arg == 'debug':
+        options.mode  = MODE_DEBUG
+        options.debug = True
+      elif arg == 'demo':
+        options.mode = MODE_DEMO
+      elif arg == 'replay':
+        options.mode = MODE_REPLAY
+    elif opt == '-r':      #Set init mode to random
+      options.randInit = INIT_RAND
+    elif opt == '-p':      #Set buffer poll delay
+      options.pollDelay = int(arg)
+    elif opt == '-b':      #Enable blitting
+      options.blit = True
+    elif opt == '-o':      #Render to file/pipe instead of a window
+      options.output = arg
+    elif opt == '-f':      #Set headless frame rate
+      options.fps = float(arg)
+    elif opt == '-n':      #Set number of headless frames
+      options.frames = int(arg)
+    elif opt == '-l':      #Record polled buffers to log
+      options.logPath = arg
+    elif opt == '-s':      #Set replay speed
+      options.speed = float(arg)
+    elif opt == '-t':      #Set replay start
+      options.seekTime = float(arg)
+    elif opt == '-d':      #Read buffers from local DSM stand-in
+      options.localDir = arg
+    elif opt == '-c':      #Dump frame timing to CSV
+      options.timingPath = arg
+    elif opt == '-i':      #Report time of each startup step
+      options.report = True
+    elif opt == '-L':      #Choose and place panels
+      try:
+        options.layout = parseLayout(arg)
+      except ValueError as err:
+        print(err)
+        print(usage)
+        sys.exit(2)
+    elif opt == '-w':      #Set server fetch deadline
+      options.deadline = int(arg)
+    elif opt == '-g':      #Decode and show debug only buffers
+      options.debug = True
+
+  if options.mode == MODE_REPLAY:
+    if len(args) != 1:
+      print('Replay mode needs exactly one log to play')
+      print(usage)
+      sys.exit(2)
+    options.replayPath = args[0]
+
+  return options
+
+'''makeSource------------------------------------------------------------------
+Data source for options.mode, polling table or replaying into it. A poll
+thread starts from a copy of data, the initial displayed data
+----------------------------------------------------------------------------'''
+def makeSource(options, table, recorder = None, data = None):
+  from monitor.sources import DemoSource, DsmSource, ReplaySource
+  from monitor.table import CLIENT_SERV, CLIENT_ID
+
+  mode = options.mode
+  if mode == MODE_DEMO:
+    return DemoSource()
+
+  if mode == MODE_REPLAY:
+    from monitor.replay import LogReader
+    print('[Info   ] Opening replay log {}'.format(options.replayPath))
+    reader = LogReader(options.replayPath)
+    print('[Info   ] Log spans {:.1f} s'.format(reader.end - reader.start))
+    return ReplaySource(reader, table, options.speed, 1.0 / options.fps,
+                        options.debug, options.seekTime)
+
+  #Initialize client, pydsm is only needed when connecting to real servers
+  if options.localDir is not None:
+    from monitor import localdsm
+    print('[Info   ] Using local DSM in {}'.format(options.localDir))
+    client = localdsm.Client(CLIENT_SERV, CLIENT_ID, True, options.localDir)
+  else:
+    import pydsm
+    client = pydsm.Client(CLIENT_SERV, CLIENT_ID, True)
+
+  return DsmSource(client, table, options.debug, options.pollDelay,
+                   recorder, options.deadline, data)
+
+'''makeRecorder----------------------------------------------------------------
+Records raw buffers as they are polled, written out on a background thread.
+None if not recording or there is nothing to record
+----------------------------------------------------------------------------'''
+def makeRecorder(options):
+  if options.logPath is None:
+    return None
+  if options.mode == MODE_DEMO or options.mode == MODE_REPLAY:
+    print('[Warning] Nothing to record in {} mode'.format(
+          MODE_STR[options.mode].strip()))
+    return None
+
+  from monitor.recorder import Recorder
+  print('[Info   ] Recording buffers to {}'.format(options.logPath))
+  recorder = Recorder(options.logPath)
+  recorder.start()
+  return recorder
+
+'''run-------------------------------------------------------------------------
+Draws frames with renderer in a window, or headless to options.output, until
+the window is closed or the headless run ends
+----------------------------------------------------------------------------'''
+def run(renderer, options):
+  canvas = renderer.figure.fig.canvas
+
+  #Replay at speed 0 steps the log once per frame, so draw frames back to back
+  asFast = options.mode == MODE_REPLAY and options.speed == 0
+
+  if options.output is not None:
+    from monitor.headless import FrameWriter, runHeadless
+
+    #Render frames to output at fps until interrupted or frames are written
+    runHeadless(renderer.update, FrameWriter(canvas, options.output),
+                0 if asFast else options.fps, options.frames)
+  else:
+    import matplotlib.pyplot as plt
+
+    #Timer only draws when something changed
+    timer = canvas.new_timer(interval = 1 if asFast else options.delay)
+    timer.add_callback(renderer.update)
+    timer.start()
+
+    #Show the figure, returns once the window is closed
+    plt.show()
+
+'''main------------------------------------------------------------------------
+Runs the monitor with command line args argv. forceMode fixes the mode
+regardless of -m, blit and delay set defaults of -b and drawing rate
+----------------------------------------------------------------------------'''
+def main(argv, prog = 'statusmon.py', forceMode = None, blit = False,
+         delay = DELAY):
+  startup = StartupTimer()
+  options = parseArgs(argv, Options(blit, delay), prog)
+  if forceMode is not None:
+    options.mode = forceMode
+  mode = options.mode
+  layout = options.layout or Layout()
+
+  #Frames go to stdout, so keep log messages out of the stream
+  if options.output == '-':
+    sys.stdout = sys.stderr
+
+  print('[Info   ] Mode: {}'.format(MODE_STR[mode]))
+  print('[Info   ] Init: {}'.format(INIT_STR[options.randInit]))
+  if options.output is not None:
+    print('[Info   ] Output: {} at {} fps'.format(options.output, options.fps))
+  print('[Info   ] Panels: {}'.format(', '.join(layout.panels())))
+
+  from monitor.table import makeBufferTable, panelRow
+  table = makeBufferTable()
+  layout.skipDecoding(table)
+  startup.mark('Buffer table')
+
+  #Holds all displayed data from buffers
+  from monitor.data import MonitorData
+  print('[Info   ] Initializing data')
+  data = MonitorData(len(table))
+  if options.randInit == INIT_RAND:
+    data.randomize()
+
+  recorder = makeRecorder(options)
+  source   = makeSource(options, table, recorder, data)
+  startup.mark('Data source')
+
+  from monitor.figure import StatusFigure
+  from monitor.renderer import Renderer, TIMING_STAGES
+  from monitor.timing import FrameTimer
+  startup.mark('Import matplotlib')
+
+  #Headless figures draw straight to Agg, only a window needs pyplot
+  figure = StatusFigure([entry.label for entry in table],
+                        '{} Mode'.format(MODE_STR[mode]),
+                        options.randInit == INIT_RAND,
+                        gui = options.output is None, layout = layout,
+                        orientationRow = panelRow(table, 'orientation'))
+  if options.blit:
+    figure.enableBlit()
+  startup.mark('Figure')
+
+  #Times each stage of every frame, shown in the status panel
+  timer    = FrameTimer(TIMING_STAGES, TIMING_WINDOW, options.timingPath)
+  renderer = Renderer(figure, source, data, timer, options.debug)
+
+  #Draw the first frame now so a window never opens on empty axes
+  renderer.update()
+  startup.mark('First frame')
+  print('[Info   ] Started in {:.0f} ms'.format(startup.total() * 1000))
+  if options.report:
+    print(startup.summary())
+
+  try:
+    run(renderer, options)
+  finally:
+    #Stop background threads, finishing the log if recording and timing CSV
+    timer.close()
+    source.close()
+    if recorder is not None:
+      recorder.stop()
+      print('[Info   ] Recording saved to {}'.format(options.logPath))
@@ -0,0 +1,70 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : autoscale.py
+   Description: Axis autoscaling with hysteresis. Limits grow as soon as data
+                leaves them but only shrink once the data has fit in smaller
+                limits for a while, and always land on nice tick steps, so
+                ticks are relaid out rarely instead of nearly every frame.
+---*-----------------------------------------------------------------------*'''
+import math, time
+import numpy as np
+
+#Tick steps allowed within each power of 10
+NICE_STEPS = (1, 2, 2.5, 5, 10)
+
+'''AutoScaler------------------------------------------------------------------
+Picks axis limits for a data range, shrinking only after dwell seconds
+----------------------------------------------------------------------------'''
+class AutoScaler(object):
+  def __init__(self, dwell, numTicks = 7):
+    self.dwell    = dwell    #Seconds data must fit smaller limits to shrink
+    self.numTicks = numTicks #Most ticks to place on axis
+    self.limits   = None     #Current (min, max)
+    self.ticks    = None     #Current tick locations
+    self.since    = None     #When data first fit in smaller limits
+
+  #Fit limits to data spanning lo to hi, returns True if limits changed
+  def update(self, lo, hi, now = None):
+    if now is None:
+      now = time.monotonic()
+    limits, ticks = niceLimits(lo, hi, self.numTicks)
+
+    if self.limits is None or limits[0] < self.limits[0] or \
+       limits[1] > self.limits[1]:
+      #Data left current limits, grow right away
+      self.since = None
+    elif limits == self.limits:
+      self.since = None
+      return False
+    else:
+      #Data fits in smaller limits, wait for it to stay there before shrinking
+      if self.since is None:
+        self.since = now
+      if now - self.since < self.dwell:
+        return False
+      self.since = None
+
+    self.limits = limits
+    self.ticks  = ticks
+    return True
+
+'''niceLimits------------------------------------------------------------------
+Smallest limits covering lo to hi using at most numTicks ticks on a nice step
+----------------------------------------------------------------------------'''
+def niceLimits(lo, hi, numTicks):
+  if hi <= lo:
+    hi = lo + 1
+
+  #Smallest nice step that covers the range in numTicks - 1 steps
+  rough = (hi - lo) / (numTicks - 1)
+  power = 10 ** math.floor(math.log10(rough))
+  for nice in NICE_STEPS:
+    step = nice * power
+    ymin = math.floor(lo / step) * step
+    ymax = math.ceil(hi / step) * step
+    if (ymax - ymin) / step <= numTicks - 1 + 1e-9:
+      break
+
+  ticks = np.linspace(ymin, ymax, int(round((ymax - ymin) / step)) + 1)
+  return (ymin, ymax), ticks
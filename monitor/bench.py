@@ -0,0 +1,287 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : bench.py
+   Description: Benchmarks each stage of a frame and whole frames, printing
+                results as JSON so runs can be compared between versions.
+                The monitor core is built headless (Agg) against a local DSM
+                stand-in, so no display, DSMServer or robot is needed.
+
+   Usage      : python3 -m monitor.bench [-o] <json> [-q]
+---*-----------------------------------------------------------------------*'''
+import sys, getopt, contextlib, json, platform, shutil, tempfile, \
+       threading, time
+import numpy as np
+import matplotlib
+from Master import *
+from Navigation import *
+from Sensor import *
+from Vision import *
+from Serialization import Pack, Unpack
+from Dtypes import View
+from QuaternionFuncs import qv_mult, qv_mult_batch
+from monitor import localdsm
+from monitor.buffers import BufferEntry, BufferPool
+from monitor.data import MonitorData
+from monitor.figure import StatusFigure, HIST_LENGTH
+from monitor.renderer import Renderer, TIMING_STAGES
+from monitor.ringbuffer import RingBuffer
+from monitor.sources import DemoSource, DsmSource
+from monitor.table import CLIENT_SERV, CLIENT_ID, makeBufferTable, panelRow
+from monitor.timing import FrameTimer
+
+#Structs statusmon unpacks
+STRUCTS = [Kill, Health, Outputs, PhysicalOutput, Linear, Angular,
+           ControlInput, Location, LocationArray]
+
+#Parameters swept, full runs and quick (-q) runs
+HIST_LENGTHS  = [50, 500, 5000]
+POLL_RATES    = [0, 50, 100, 500] #ms between polls of each buffer, 0 always
+FRAMES        = 30                #Frames per whole frame benchmark
+QUICK_FRAMES  = 5
+FETCH_LATENCY = 2                 #ms network delay added to each fetch
+
+'''measure---------------------------------------------------------------------
+Times func() number calls at a time, repeat times, and summarizes microseconds
+per call
+----------------------------------------------------------------------------'''
+def measure(func, number = 1000, repeat = 5):
+  perCall = []
+  for r in range(repeat):
+    start = time.perf_counter()
+    for n in range(number):
+      func()
+    perCall.append((time.perf_counter() - start) / number * 1e6)
+  return {'calls': number * repeat,
+          'min_us': min(perCall),
+          'median_us': float(np.median(perCall)),
+          'mean_us': float(np.mean(perCall))}
+
+#Time each call of func separately, for slow calls like whole frames, and
+#count calls that returned True (frames that were redrawn)
+def measureEach(func, number):
+  perCall = []
+  passed  = 0
+  for n in range(number):
+    start = time.perf_counter()
+    if func():
+      passed += 1
+    perCall.append((time.perf_counter() - start) * 1e6)
+  return {'calls': number,
+          'true_calls': passed,
+          'min_us': min(perCall),
+          'median_us': float(np.median(perCall)),
+          'p99_us': float(np.percentile(perCall, 99)),
+          'mean_us': float(np.mean(perCall))}
+
+'''Bench-----------------------------------------------------------------------
+Collects results as (name, params, stats) rows
+----------------------------------------------------------------------------'''
+class Bench(object):
+  def __init__(self, quick = False):
+    self.quick   = quick
+    self.results = []
+
+  def add(self, name, params, stats):
+    row = {'name': name, 'params': params}
+    row.update(stats)
+    self.results.append(row)
+    print('[Info   ] {:<8} {:<52} {:>10.2f} us'.format(name,
+          json.dumps(params, sort_keys = True), stats['median_us']),
+          file = sys.stderr)
+
+  #Unpack of every struct into a record decoders can read, new instance and
+  #view per call vs a bound buffer's struct refilled in place
+  def unpack(self):
+    number = 1000 if self.quick else 20000
+    for ctype in STRUCTS:
+      contents = Pack(ctype())
+      entry = BufferEntry(ctype.__name__, ctype.__name__, '', 0, ctype, None)
+      entry.bind(BufferPool())
+      self.add('unpack', {'struct': ctype.__name__, 'method': 'copy'},
+               measure(lambda: View(ctype, Unpack(ctype, contents)), number))
+      self.add('unpack', {'struct': ctype.__name__, 'method': 'inplace'},
+               measure(lambda: entry.refill(contents), number))
+
+  #Cube and arrow points rotated one point at a time vs all at once
+  def cube(self, renderer):
+    figure = renderer.figure
+    number = 500 if self.quick else 5000
+    quat   = (0.9238795, 0, 0.3826834, 0)
+    points = np.vstack((figure.cubePoints, figure.arrowPoints))
+    out    = np.empty_like(points)
+    self.add('cube', {'method': 'per_point'},
+             measure(lambda: [qv_mult(quat, tuple(p)) for p in points],
+                     number // 10))
+    self.add('cube', {'method': 'batch'},
+             measure(lambda: qv_mult_batch(quat, points, out = out), number))
+    self.add('cube', {'method': 'updateOrientation'},
+             measure(lambda: figure.updateOrientation(renderer.data),
+                     number))
+
+  #Appending a movement sample to history of each length
+  def history(self):
+    number = 1000 if self.quick else 20000
+    sample = np.random.rand(11)
+    for length in HIST_LENGTHS:
+      hist = RingBuffer(11, length)
+      hist.reset(np.random.rand(11, length))
+      self.add('history', {'length': length},
+               measure(lambda: hist.append(sample), number))
+
+  #Polling all 14 buffers through the local DSM, every buffer due each call
+  def poll(self, renderer, source):
+    number = 100 if self.quick else 2000
+    setPollRate(source.table, 0)
+    for debug in (False, True):
+      source.debug = debug
+      self.add('poll', {'buffers': len(source.table), 'debug': debug},
+               measure(lambda: source.poll(renderer.data), number))
+    source.debug = False
+
+  #Polling all buffers from servers with FETCH_LATENCY each, one server at a
+  #time vs every server at once
+  def fetch(self, dsmDir):
+    number = 10 if self.quick else 100
+    client = SlowClient(localdsm.Client(CLIENT_SERV, CLIENT_ID, True, dsmDir),
+                        FETCH_LATENCY / 1000.0)
+    data   = MonitorData(len(makeBufferTable()))
+    for method, deadline in (('sequential', 0), ('concurrent', 1000)):
+      table = makeBufferTable()
+      setPollRate(table, 0)
+      with contextlib.redirect_stdout(sys.stderr):
+        source = DsmSource(client, table, deadline = deadline)
+      self.add('fetch', {'method': method, 'latency_ms': FETCH_LATENCY},
+               measure(lambda: source.poll(data), number))
+      source.close()
+
+  #Whole frames (acquire, decode, update subplots, Agg draw) per data source,
+  #poll rate and history length
+  def frames(self, renderer, source):
+    number = QUICK_FRAMES if self.quick else FRAMES
+
+    renderer.source = DemoSource()
+    for length in HIST_LENGTHS:
+      setHistLength(renderer, length)
+      renderer.update()
+      self.add('frame', {'source': 'demo', 'length': length},
+               measureEach(renderer.update, number))
+    setHistLength(renderer, HIST_LENGTH)
+
+    renderer.source = source
+    for rate in POLL_RATES:
+      setPollRate(source.table, rate)
+      renderer.update()
+      self.add('frame', {'source': 'local_dsm', 'poll_ms': rate},
+               measureEach(renderer.update, number))
+
+#Make every buffer in table poll every rate ms, 0 polls every buffer every call
+def setPollRate(table, rate):
+  for entry in table:
+    entry.interval    = rate / 1000.0
+    entry.maxInterval = rate / 1000.0
+    entry.curInterval = rate / 1000.0
+    entry.nextPoll    = 0
+
+#DSM client taking latency s longer to fetch each buffer, like a real network
+class SlowClient(object):
+  def __init__(self, client, latency):
+    self.client  = client
+    self.latency = latency
+
+  def registerRemoteBuffer(self, name, ip, serverId):
+    self.client.registerRemoteBuffer(name, ip, serverId)
+
+  def getRemoteBufferContents(self, name, ip, serverId):
+    time.sleep(self.latency)
+    return self.client.getRemoteBufferContents(name, ip, serverId)
+
+#Swap the movement history for one of length samples
+def setHistLength(renderer, length):
+  renderer.figure.setHistLength(length)
+  renderer.tracker.reset()
+
+'''buildCore-------------------------------------------------------------------
+Builds the monitor core headless (Agg, no pyplot), polling the local DSM in
+dsmDir once per frame. Returns the renderer and its DSM source
+----------------------------------------------------------------------------'''
+def buildCore(dsmDir):
+  #Keep the core's log lines out of the JSON on stdout
+  with contextlib.redirect_stdout(sys.stderr):
+    table  = makeBufferTable()
+    client = localdsm.Client(CLIENT_SERV, CLIENT_ID, True, dsmDir)
+    source = DsmSource(client, table)
+    figure = StatusFigure([entry.label for entry in table], 'Live  Mode',
+                          orientationRow = panelRow(table, 'orientation'))
+    timer  = FrameTimer(TIMING_STAGES)
+  return Renderer(figure, source, MonitorData(len(table)), timer), source
+
+'''runBench--------------------------------------------------------------------
+Runs every benchmark, returns results with enough context to compare runs
+----------------------------------------------------------------------------'''
+def runBench(quick = False):
+  bench = Bench(quick)
+
+  #Publish synthetic buffers in the background for the live benchmarks
+  dsmDir    = tempfile.mkdtemp(prefix = 'statusmon-bench-')
+  publisher = localdsm.Publisher(dsmDir)
+  thread = threading.Thread(target = localdsm.runPublisher,
+                            args = (publisher,), name = 'Publisher')
+  thread.daemon = True
+  thread.start()
+  time.sleep(0.2)
+
+  try:
+    renderer, source = buildCore(dsmDir)
+    bench.unpack()
+    bench.cube(renderer)
+    bench.history()
+    bench.poll(renderer, source)
+    bench.fetch(dsmDir)
+    bench.frames(renderer, source)
+  finally:
+    shutil.rmtree(dsmDir, ignore_errors = True)
+
+  return {'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+          'quick': quick,
+          'python': platform.python_version(),
+          'numpy': np.__version__,
+          'matplotlib': matplotlib.__version__,
+          'platform': platform.platform(),
+          'results': bench.results}
+
+'''Main------------------------------------------------------------------------
+Run benchmarks and write JSON to stdout or a file
+----------------------------------------------------------------------------'''
+if __name__ == '__main__':
+  usage = 'Usage: python3 -m monitor.bench [-o] <json> [-q] | [-h]\n'\
+          '  -o   Write JSON to file instead of stdout\n'\
+          '  -q   Quick run with fewer calls and frames\n'\
+          '  -h   Show help'
+
+  try:
+    opts, args = getopt.getopt(sys.argv[1:], 'ho:q')
+  except getopt.GetoptError as err:
+    print(err)
+    print(usage)
+    sys.exit(2)
+
+  path  = None
+  quick = False
+  for opt, arg in opts:
+    if opt == '-h':
+      print(usage)
+      sys.exit()
+    elif opt == '-o':
+      path = arg
+    elif opt == '-q':
+      quick = True
+
+  report = runBench(quick)
+  if path is None:
+    json.dump(report, sys.stdout, indent = 2)
+    print()
+  else:
+    with open(path, 'w') as jsonFile:
+      json.dump(report, jsonFile, indent = 2)
+    print('[Info   ] Results written to {}'.format(path), file = sys.stderr)
@@ -0,0 +1,62 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : blit.py
+   Description: Blitting for the status monitor. Everything that does not
+                change per frame (grids, polar theta lines, pane colors,
+                titles) is rendered once into a cached background, and only
+                the registered data artists are redrawn over it each frame.
+---*-----------------------------------------------------------------------*'''
+
+'''BlitManager-----------------------------------------------------------------
+Caches the figure background and redraws only animated artists over it
+----------------------------------------------------------------------------'''
+class BlitManager(object):
+  def __init__(self, canvas, artists = ()):
+    self.canvas     = canvas
+    self.artists    = []
+    self.background = None #Figure without animated artists
+    self.stale      = True #Background needs a full redraw
+
+    for artist in artists:
+      self.add(artist)
+
+    #Full draws (first show, resizes, invalidation) refresh the background
+    canvas.mpl_connect('draw_event', self._onDraw)
+
+  #Redraw artist every frame instead of baking it into the background
+  def add(self, artist):
+    artist.set_animated(True)
+    self.artists.append(artist)
+
+  #Something in the background changed, e.g. axis limits or ticks
+  def invalidate(self):
+    self.stale = True
+
+  #Draw current frame to the screen
+  def update(self):
+    if self.stale or self.background is None:
+      #Full draw renders the background, then _onDraw adds the artists
+      self.canvas.draw()
+    else:
+      self.canvas.restore_region(self.background)
+      self._drawArtists()
+    self.canvas.blit(self.canvas.figure.bbox)
+    self.canvas.flush_events()
+
+  def _onDraw(self, event):
+    self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+    self.stale = False
+    self._drawArtists()
+
+  def _drawArtists(self):
+    figure = self.canvas.figure
+    for artist in self.artists:
+      #3D artists are normally projected by their axes' draw, which blitting
+      #skips, so project them here against the cached view
+      if hasattr(artist, 'do_3d_projection'):
+        try:
+          artist.do_3d_projection()
+        except TypeError:
+          artist.do_3d_projection(self.canvas.get_renderer())
+      figure.draw_artist(artist)
@@ -0,0 +1,171 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : buffers.py
+   Description: Long-lived storage for the remote DSM buffers the monitor
+                polls. Each registered buffer owns one ctypes instance that
+                is refilled in place every poll instead of reallocated, and
+                a checksum of its payload tracks when it last changed, how
+                often it changes and whether its writer has stopped.
+---*-----------------------------------------------------------------------*'''
+import zlib
+import numpy as np
+from Dtypes import View
+
+#Staleness, a buffer that stays active but stops changing for STALE_CHANGES
+#of its usual change intervals (and at least STALE_MIN s) is stale
+RATE_SMOOTHING = 0.25 #Weight of newest change interval in the rate
+STALE_CHANGES  = 5
+STALE_MIN      = 1.0
+
+'''BufferPool------------------------------------------------------------------
+Owns one ctypes instance per remote buffer, keyed by (name, ip, server id)
+----------------------------------------------------------------------------'''
+class BufferPool(object):
+  def __init__(self):
+    self.instances = {}
+
+  #Allocate the instance backing a buffer, reusing it if already registered
+  def register(self, name, ip, serverId, ctype):
+    key = (name, ip, serverId)
+    instance = self.instances.get(key)
+    if instance is None:
+      instance = ctype()
+      self.instances[key] = instance
+    elif type(instance) is not ctype:
+      raise TypeError('Buffer {} on {} ({}) already registered as {}'.format(
+                      name, ip, serverId, type(instance).__name__))
+    return instance
+
+'''BufferEntry-----------------------------------------------------------------
+One row of the buffer table: where a buffer lives, its struct, the decoder
+that copies it into MonitorData and the panel that displays what it decodes
+----------------------------------------------------------------------------'''
+class BufferEntry(object):
+  def __init__(self, label, name, ip, serverId, ctype, decoder, 
+               debugOnly = False, interval = 100, maxInterval = 2000,
+               panel = None):
+    self.label     = label     #Name shown in status panel
+    self.name      = name      #DSM buffer name
+    self.ip        = ip        #IP of server holding buffer
+    self.serverId  = serverId  #Id of server holding buffer
+    self.ctype     = ctype     #Struct stored in buffer
+    self.decoder   = decoder   #decoder(view, data), see monitor.decoders,
+                               #None for buffers with no panel
+    self.debugOnly = debugOnly #Only decode in debug mode
+    self.panel     = panel     #Panel displaying decoded data, see layout
+    self.decoded   = panel is not None #False when that panel is not shown
+    self.instance  = None
+    self.view      = None
+    self.raw       = None #Bytes of instance, written by refill
+
+    #Polling schedule, intervals given in ms and stored in seconds
+    self.interval    = interval / 1000.0    #Delay between polls when active
+    self.maxInterval = maxInterval / 1000.0 #Backoff limit when inactive
+    self.curInterval = self.interval        #Delay until the poll after next
+    self.nextPoll    = 0                    #Monotonic time of next poll
+
+    self.resetTracking()
+
+  #Whether this buffer should be polled at time now
+  def due(self, now):
+    return now >= self.nextPoll
+
+  #Schedule next poll, backing off exponentially while buffer is inactive
+  def schedule(self, now, active):
+    if active:
+      self.curInterval = self.interval
+    else:
+      self.curInterval = min(self.curInterval * 2, 
+                             max(self.maxInterval, self.interval))
+    self.nextPoll = now + self.curInterval
+
+  #Forget payload changes seen so far, e.g. when replay jumps in time
+  def resetTracking(self):
+    self.checksum       = None #Checksum of last payload
+    self.lastChange     = None #Time payload last changed
+    self.changeInterval = None #Smoothed seconds between changes
+
+  '''track---------------------------------------------------------------------
+  Notes contents polled at time now, returns its freshness
+  --------------------------------------------------------------------------'''
+  def track(self, contents, now):
+    checksum = zlib.adler32(contents)
+    if checksum != self.checksum:
+      if self.lastChange is not None:
+        interval = now - self.lastChange
+        if self.changeInterval is None:
+          self.changeInterval = interval
+        else:
+          self.changeInterval += RATE_SMOOTHING * (interval -
+                                                   self.changeInterval)
+      self.checksum   = checksum
+      self.lastChange = now
+    return self.freshness(now)
+
+  '''freshness-----------------------------------------------------------------
+  (age, rate) at time now: seconds since the payload last changed and changes
+  per second. Changes are only seen when polled, so rate is at most the poll
+  rate. A payload that stops changing pulls rate down as its age grows
+  --------------------------------------------------------------------------'''
+  def freshness(self, now):
+    age = now - self.lastChange
+    if not self.changeInterval:
+      return age, 0.0
+    return age, 1.0 / max(self.changeInterval, age)
+
+  #Whether a payload of age s has stopped changing at its usual rate
+  def stale(self, age):
+    if not self.changeInterval:
+      return False
+    return age > max(STALE_CHANGES * self.changeInterval, STALE_MIN)
+
+  #Take this buffer's struct from pool and view it as a numpy record
+  def bind(self, pool):
+    self.instance = pool.register(self.name, self.ip, self.serverId, 
+                                  self.ctype)
+    self.view = View(self.ctype, self.instance)
+    self.raw  = memoryview(self.instance).cast('B')
+
+  #Copy bytes contents into struct, so view shows them without a new Unpack
+  #and View per poll. Bytes past the end of short contents keep old values
+  def refill(self, contents):
+    size = min(len(contents), len(self.raw))
+    self.raw[:size] = contents[:size]
+
+  #Refill struct with latest contents and decode it into data
+  def decode(self, contents, data):
+    self.refill(contents)
+    self.decoder(self.view, data)
+
+'''storeBuffer-----------------------------------------------------------------
+Decode contents of table[i] polled at time now into data, mark the buffer up,
+down or stale and note its age and rate. Debug only buffers are skipped
+unless debug is set, as are buffers whose panel is not shown
+----------------------------------------------------------------------------'''
+def storeBuffer(table, i, contents, active, debug, data, now):
+  entry = table[i]
+  if active:
+    #Contents may arrive as a sequence of ints, checksum and decode bytes
+    if not isinstance(contents, bytes):
+      contents = bytes(contents)
+    if entry.decoded and (debug or not entry.debugOnly):
+      entry.decode(contents, data)
+    data.ages[i], data.rates[i] = entry.track(contents, now)
+
+    #Set status string to indicate whether buffer is up, stale or down
+    data.statusStrings[i] = 'Stale' if entry.stale(data.ages[i]) else 'Up  '
+  else:
+    data.statusStrings[i] = 'Down'
+
+'''ageBuffers------------------------------------------------------------------
+Note the age and rate of every buffer in table at time now, so buffers that
+are down, late or not due keep aging between the polls that track them
+----------------------------------------------------------------------------'''
+def ageBuffers(table, data, now):
+  for i in range(len(table)):
+    if table[i].lastChange is None:
+      data.ages[i]  = np.nan
+      data.rates[i] = 0.0
+    else:
+      data.ages[i], data.rates[i] = table[i].freshness(now)
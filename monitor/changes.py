@@ -0,0 +1,35 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : changes.py
+   Description: Remembers the data each subplot was last drawn from so
+                subplots whose data has not changed can skip updating.
+---*-----------------------------------------------------------------------*'''
+import numpy as np
+
+'''ChangeTracker---------------------------------------------------------------
+Compares each panel's input data against what it was last updated with
+----------------------------------------------------------------------------'''
+class ChangeTracker(object):
+  def __init__(self):
+    self.last = {}
+
+  #True if any of values differs from the last call for panel
+  def changed(self, panel, *values):
+    key = tuple(_snapshot(value) for value in values)
+    if self.last.get(panel) == key:
+      return False
+    self.last[panel] = key
+    return True
+
+  #Forget everything so every panel updates on its next check
+  def reset(self):
+    self.last.clear()
+
+#Comparable copy of a value, numeric arrays are compared by their raw bytes
+def _snapshot(value):
+  if isinstance(value, np.ndarray):
+    if value.dtype == object:
+      return tuple(value.flat)
+    return value.tobytes()
+  return value
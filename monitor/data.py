@@ -0,0 +1,58 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : data.py
+   Description: Arrays holding everything the monitor displays. Buffer
+                decoders write into these and the subplots read from them.
+---*-----------------------------------------------------------------------*'''
+import numpy as np
+
+'''MonitorData-----------------------------------------------------------------
+Latest decoded values of every buffer, laid out the way the subplots use them
+----------------------------------------------------------------------------'''
+class MonitorData(object):
+  def __init__(self, numBuffers):
+    #Displayed data
+    self.cvforward     = np.zeros((3, 5))  #x, y, z, confidence, loctype
+    self.cvdown        = np.zeros((5))     #x, y, z, confidence, loctype
+    self.sonar         = np.zeros((5))     #x, y, z, confidence, loctype
+    self.orientation   = np.zeros((4))     #Quaternion w, x, y, z
+    self.thruster      = np.zeros((2, 4))  #Motor outputs 1-4, 5-8
+    self.movement      = np.zeros((3, 4))  #pos, vel, acc by axis
+    self.status        = np.empty(3, dtype = object) #killed, sat, direction
+    self.statusStrings = np.empty(numBuffers, dtype = object)
+    self.ages          = np.full(numBuffers, np.nan) #s since payload changed
+    self.rates         = np.zeros(numBuffers)        #Payload changes per s
+
+    #Debug data
+    self.masterControl = np.zeros((3, 3, 3)) #ang/lin/mode by axis, vel/pos
+    self.nav           = np.zeros((2, 6))    #lin/ang force xyz, torque xyz
+
+  #Copy every array from other into this one's existing arrays
+  def copyFrom(self, other):
+    for name, array in vars(self).items():
+      array[...] = getattr(other, name)
+
+  #Start CV targets at random positions instead of all at the origin
+  def randomize(self):
+    for i in range(3):
+      self.cvforward[i][0] = np.random.randint(0, 5)
+      self.cvforward[i][1] = np.random.randint(-5, 5)
+      self.cvforward[i][2] = np.random.randint(-10, 10)
+      self.cvforward[i][3] = np.random.randint(0, 255)
+      self.cvforward[i][4] = np.random.randint(0, 5)
+
+    self.cvdown[0] = np.random.randint(0, 5)
+    self.cvdown[1] = np.random.randint(-5, 5)
+    self.cvdown[2] = np.random.randint(-10, 10)
+    self.cvdown[3] = np.random.randint(0, 255)
+    self.cvdown[4] = np.random.randint(0, 5)
+
+  #Keep CV target values within what the polar plot can display, so the
+  #monitor doesn't crash if CV returns crazy values
+  def clampTargets(self):
+    np.clip(self.cvforward[:, 2], -10, 0, out = self.cvforward[:, 2])
+    np.clip(self.cvforward[:, 3], 0, 255, out = self.cvforward[:, 3])
+    for target in (self.cvdown, self.sonar):
+      target[2] = min(max(target[2], -10), 10)
+      target[3] = min(max(target[3], 0), 255)
@@ -0,0 +1,67 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : decoders.py
+   Description: One decoder per buffer. Each takes a structured numpy view
+                of the buffer's struct and copies its fields into the
+                matching MonitorData arrays as whole slices.
+---*-----------------------------------------------------------------------*'''
+import numpy as np
+
+#ControlInput.mode bits 0-2 put angular axes, bits 3-5 linear axes, in pos mode
+CONTROL_MODE_BITS = (1 << np.arange(6)).reshape(2, 3)
+
+def decodeKill(view, data):
+  data.status[0] = bool(view['isKilled'])
+
+def decodeHealth(view, data):
+  data.status[1] = int(view['saturated'])
+  data.status[2] = int(view['direction'])
+
+def decodeOutputs(view, data):
+  data.thruster[:] = view['motors'].reshape(2, 4)
+
+def decodeMotorLinear(view, data):
+  data.nav[0][:3] = view['force']
+  data.nav[0][3:] = view['torque']
+
+def decodeMotorAngular(view, data):
+  data.nav[1][:3] = view['force']
+  data.nav[1][3:] = view['torque']
+
+def decodeSensorsLinear(view, data):
+  data.movement[0][:3] = view['pos']
+  data.movement[1][:3] = view['vel']
+  data.movement[2][:3] = view['acc']
+
+def decodeSensorsAngular(view, data):
+  data.orientation[:] = view['pos']
+
+def decodeMasterControl(view, data):
+  controlMode = int(view['mode'])
+  data.masterControl[2][0][0] = controlMode
+
+  #Axes in position mode show pos1/pos2, the rest show vel
+  posMode = (CONTROL_MODE_BITS & controlMode) != 0
+  for j, axis in ((0, view['angular']), (1, view['linear'])):
+    data.masterControl[j, :, 0]  = np.where(posMode[j], 0, axis['vel'])
+    data.masterControl[j, :, 1:] = np.where(posMode[j][:, None],
+                                            axis['pos'], 0)
+
+def decodeCVForward(view, data):
+  locations = view['locations']
+  data.cvforward[:, 0] = locations['x']
+  data.cvforward[:, 1] = locations['y']
+  data.cvforward[:, 2] = locations['z']
+  data.cvforward[:, 3] = locations['confidence']
+  data.cvforward[:, 4] = locations['loctype']
+
+def _decodeLocation(view, target):
+  target[:] = (view['x'], view['y'], view['z'],
+               view['confidence'], view['loctype'])
+
+def decodeCVDown(view, data):
+  _decodeLocation(view, data.cvdown)
+
+def decodeSonar(view, data):
+  _decodeLocation(view, data.sonar)
@@ -0,0 +1,176 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : export.py
+   Description: Converts a recorded log into one .npy per struct field, plus a
+                time column, for post-dive analysis. Columns are written
+                through memory maps a chunk of records at a time, so a whole
+                dive is never held in memory, and open with
+                np.load(path, mmap_mode = 'r').
+
+   Usage      : python3 -m monitor.export <log> <output dir> [-c] <records>
+---*-----------------------------------------------------------------------*'''
+import os, sys, getopt
+import numpy as np
+from numpy.lib.format import open_memmap
+from Constants import *
+from Navigation import Outputs
+from Sensor import Linear, Angular
+from Vision import Location, LocationArray
+from Dtypes import ToDtype
+from monitor.replay import LogReader
+
+CHUNK_RECORDS = 4096 #Records per buffer decoded at once
+
+#Buffers to export, (name, server id) -> (output directory, struct)
+EXPORT_BUFFERS = {
+  (SENSORS_LINEAR,  SENSOR_SERVER_ID):          ('sensor_linear',  Linear),
+  (SENSORS_ANGULAR, SENSOR_SERVER_ID):          ('sensor_angular', Angular),
+  (MOTOR_OUTPUTS,   MOTOR_SERVER_ID):           ('motor_outputs',  Outputs),
+  (TARGET_LOCATION, FORWARD_VISION_SERVER_ID):  ('cvforward',
+                                                 LocationArray),
+  (TARGET_LOCATION, DOWNWARD_VISION_SERVER_ID): ('cvdown',         Location),
+  (TARGET_LOCATION, SONAR_SERVER_ID):           ('sonar',          Location)}
+
+'''Column----------------------------------------------------------------------
+Writes one buffer's active records into memory mapped columns, one per leaf
+field of its struct, buffering raw records until a chunk is full
+----------------------------------------------------------------------------'''
+class Column(object):
+  def __init__(self, directory, ctype, count, wallOffset, chunk):
+    self.dtype      = ToDtype(ctype)
+    self.size       = self.dtype.itemsize
+    self.wallOffset = wallOffset #Added to monotonic times to get epoch times
+    self.chunk      = chunk
+    self.raw        = bytearray(chunk * self.size) #Records waiting to decode
+    self.times      = np.zeros(chunk)
+    self.pending    = 0 #Records in raw
+    self.written    = 0 #Records in columns
+
+    if not os.path.isdir(directory):
+      os.makedirs(directory)
+    self.timeColumn = open_memmap(os.path.join(directory, 'time.npy'), 'w+',
+                                  np.float64, (count,))
+    self.columns = []
+    for path, dtype in leafFields(self.dtype):
+      column = open_memmap(os.path.join(directory, '.'.join(path) + '.npy'),
+                           'w+', dtype.base, (count,) + dtype.shape)
+      self.columns.append((path, column))
+
+  #Queue one record, short payloads are zero padded to the struct size
+  def add(self, timestamp, contents):
+    start = self.pending * self.size
+    contents = contents[:self.size]
+    self.raw[start:start + len(contents)] = contents
+    self.raw[start + len(contents):start + self.size] = \
+      bytes(self.size - len(contents))
+    self.times[self.pending] = timestamp + self.wallOffset
+    self.pending += 1
+    if self.pending == self.chunk:
+      self.flush()
+
+  #Decode queued records and copy each field into its column
+  def flush(self):
+    if self.pending == 0:
+      return
+    records = np.frombuffer(self.raw, self.dtype, count = self.pending)
+    rows = slice(self.written, self.written + self.pending)
+    self.timeColumn[rows] = self.times[:self.pending]
+    for path, column in self.columns:
+      field = records
+      for name in path:
+        field = field[name]
+      column[rows] = field
+    self.written += self.pending
+    self.pending  = 0
+
+  def close(self):
+    self.flush()
+    self.timeColumn.flush()
+    for path, column in self.columns:
+      column.flush()
+
+'''leafFields------------------------------------------------------------------
+(path, dtype) of every non struct field in dtype. Structs nested in arrays
+keep the array shape, e.g. LocationArray gives locations.x of shape (3,)
+----------------------------------------------------------------------------'''
+def leafFields(dtype, path = ()):
+  leaves = []
+  for name in dtype.names:
+    field = dtype.fields[name][0]
+    base  = field.base
+    if base.names is not None:
+      for subPath, subDtype in leafFields(base, path + (name,)):
+        leaves.append((subPath, np.dtype((subDtype.base,
+                                          field.shape + subDtype.shape))))
+    else:
+      leaves.append((path + (name,), field))
+  return leaves
+
+'''exportLog-------------------------------------------------------------------
+Writes the active records of each of EXPORT_BUFFERS in the log at path to
+outDir/<buffer>/<field>.npy and outDir/<buffer>/time.npy (epoch seconds).
+Returns the number of records written per buffer directory
+----------------------------------------------------------------------------'''
+def exportLog(path, outDir, chunk = CHUNK_RECORDS):
+  reader = LogReader(path)
+  try:
+    #Count first so every column can be allocated at its final size
+    counts = {}
+    for offset, timestamp, name, serverId, active, contents in \
+        reader.records():
+      key = (name, serverId)
+      if active and key in EXPORT_BUFFERS:
+        counts[key] = counts.get(key, 0) + 1
+
+    wallOffset = reader.wallStart - reader.monoStart
+    columns = {}
+    for key in counts:
+      directory, ctype = EXPORT_BUFFERS[key]
+      columns[key] = Column(os.path.join(outDir, directory), ctype,
+                            counts[key], wallOffset, chunk)
+
+    for offset, timestamp, name, serverId, active, contents in \
+        reader.records():
+      column = columns.get((name, serverId))
+      if active and column is not None:
+        column.add(timestamp, contents)
+
+    for column in columns.values():
+      column.close()
+  finally:
+    reader.close()
+
+  return dict((EXPORT_BUFFERS[key][0], counts[key]) for key in counts)
+
+'''Main------------------------------------------------------------------------
+Export the log given on the command line
+----------------------------------------------------------------------------'''
+if __name__ == '__main__':
+  usage = 'Usage: python3 -m monitor.export <log> <output dir> '\
+          '[-c] <records> | [-h]\n'\
+          '  -c   Records per buffer decoded at once (default {})\n'\
+          '  -h   Show help'.format(CHUNK_RECORDS)
+
+  try:
+    opts, args = getopt.gnu_getopt(sys.argv[1:], 'hc:')
+  except getopt.GetoptError as err:
+    print(err)
+    print(usage)
+    sys.exit(2)
+
+  chunk = CHUNK_RECORDS
+  for opt, arg in opts:
+    if opt == '-h':
+      print(usage)
+      sys.exit()
+    elif opt == '-c':
+      chunk = int(arg)
+
+  if len(args) != 2:
+    print(usage)
+    sys.exit(2)
+
+  written = exportLog(args[0], args[1], chunk)
+  for directory in sorted(written):
+    print('[Info   ] {:<15}: {} records'.format(directory, written[directory]))
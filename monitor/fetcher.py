@@ -0,0 +1,101 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : fetcher.py
+   Description: Fetches DSM buffers from every server at once. Each server
+                gets its own worker thread that fetches that server's due
+                buffers in turn, so a poll takes about as long as the slowest
+                server rather than the sum of all of them. Servers that miss
+                the deadline are left fetching in the background and their
+                buffers reported late instead of holding up the frame.
+---*-----------------------------------------------------------------------*'''
+import queue, threading, time
+
+'''Fetcher---------------------------------------------------------------------
+Fetches rows of table through client, one worker per server id, waiting at
+most deadline seconds per fetch() for results. report(server id, error) is
+called with the error of each fetch that fails, or None if it succeeds
+----------------------------------------------------------------------------'''
+class Fetcher(object):
+  def __init__(self, client, table, deadline, report):
+    self.client   = client
+    self.table    = table
+    self.deadline = deadline
+    self.report   = report
+    self.jobs     = {} #Server id -> job being fetched, until collected
+    self.queues   = {} #Server id -> jobs waiting for that server's worker
+
+    for entry in table:
+      serverId = int(entry.serverId)
+      if serverId not in self.queues:
+        self.queues[serverId] = queue.Queue()
+        thread = threading.Thread(target = self._run,
+                                  args = (self.queues[serverId],),
+                                  name = 'Fetcher {}'.format(serverId))
+        thread.daemon = True #A hung server must not keep the monitor alive
+        thread.start()
+
+  '''fetch---------------------------------------------------------------------
+  Starts fetching rows on their servers' workers and waits until all of them
+  are done or the deadline passes. Servers still busy with an earlier fetch
+  are not asked again until it finishes. Rows of a server whose fetch failed
+  are returned inactive. Returns the finished results, each (row, fetch time,
+  contents, active), and the rows still being fetched
+  --------------------------------------------------------------------------'''
+  def fetch(self, rows):
+    end = time.monotonic() + self.deadline
+
+    #Group rows by server, starting a job on every server that is free
+    groups = {}
+    for i in rows:
+      groups.setdefault(int(self.table[i].serverId), []).append(i)
+    for serverId, serverRows in groups.items():
+      if serverId not in self.jobs:
+        job = _Job(serverRows)
+        self.jobs[serverId] = job
+        self.queues[serverId].put(job)
+
+    #Collect every job that finishes before the deadline
+    results = []
+    late    = []
+    for serverId, job in list(self.jobs.items()):
+      if job.done.wait(max(0, end - time.monotonic())):
+        del self.jobs[serverId]
+        results += job.results
+        self.report(serverId, job.error)
+        if job.error is not None:
+          #Rows the failed fetch did not reach show as down
+          failed = job.rows[len(job.results):]
+          results += [(i, time.monotonic(), b'', False) for i in failed]
+      else:
+        late += job.rows
+    return results, late
+
+  #Stop workers once they finish their current job
+  def close(self):
+    for jobs in self.queues.values():
+      jobs.put(None)
+
+  def _run(self, jobs):
+    while True:
+      job = jobs.get()
+      if job is None:
+        return
+      try:
+        for i in job.rows:
+          entry = self.table[i]
+          fetched = time.monotonic()
+          contents, active = self.client.getRemoteBufferContents(entry.name,
+                                                  entry.ip, entry.serverId)
+          job.results.append((i, fetched, contents, active))
+      except Exception as err:
+        job.error = err
+      job.done.set()
+
+#Rows of one server to fetch, filled in by its worker
+class _Job(object):
+  def __init__(self, rows):
+    self.rows    = rows
+    self.results = []
+    self.error   = None
+    self.done    = threading.Event()
@@ -0,0 +1,550 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : figure.py
+   Description: The status monitor figure: a polar graph for targets,
+                orientation viewer, thruster heatmap, location/velocity/
+                acceleration plots and buffer status messages. Each subplot
+                is updated from a MonitorData, nothing here polls buffers.
+---*-----------------------------------------------------------------------*'''
+import matplotlib as mpl
+from matplotlib import style
+from matplotlib.figure import Figure
+from matplotlib.gridspec import GridSpec
+import numpy as np
+from QuaternionFuncs import qv_mult_batch
+from monitor.autoscale import AutoScaler
+from monitor.blit import BlitManager
+from monitor.layout import Layout
+from monitor.readout import Readout
+from monitor.ringbuffer import RingBuffer
+
+#Animation Constants
+NUM_PL_LINES = 36   #Number of polar theta lines to plot
+CUBE_POINTS  = 16   #Number of points in cube orientation plot
+ARROW_POINTS = 8    #Number of points in cube arrow plot
+NUM_MV_LINES = 11   #Number of movement lines to plot
+HIST_LENGTH  = 50   #Number of past data points to store for movement viewer
+SCALE_DWELL  = 3000 #Milliseconds data must fit smaller axes before shrinking
+
+#Display Constants
+FIG_WIDTH    = 16                             #Aspect width
+FIG_HEIGHT   = 8                              #Aspect height
+FIG_NAME     = 'Cubeception 3 Status Monitor' #Name displayed in window
+PLOT_STYLE   = 'dark_background'              #Background style
+LIGHT_GREEN  = (0, 1, 0, 1)                   #RGBA color, used for most things
+DARK_GREEN   = (0, 0.5, 0, 1)                 #RGBA color
+LIGHT_RED    = (1, 0.75, 0.75, 1)             #RGBA color
+DARK_RED     = (1, 0, 0, 1)                   #RGBA color
+LIGHT_YELLOW = (1, 1, 0, 1)                   #RGBA color
+DPI_DISPLAY  = 100                            #Dots per inch of display
+FONT_SIZE    = 8                              #Default text font size
+TITLE_SIZE   = 10                             #Default title font size
+
+#Colors for movement plots
+MOVE_COLORS = ['#ff0000', '#cf0000', '#8f0000', '#00ff00', '#00cf00',
+               '#008f00', '#004f00', '#0000ff', '#0000cf', '#00008f',
+               '#00004f']
+MOVE_LABELS = ['px', 'py', 'pz', 'vx', 'vy', 'vz', 'vt',
+               'ax', 'ay', 'az', 'at']
+
+'''StatusFigure----------------------------------------------------------------
+Builds the figure, subplots and every artist drawn on them, and updates each
+subplot from a MonitorData. labels name the buffers in the status panel. A
+gui figure is shown in a pyplot window, otherwise it is drawn offscreen by Agg
+----------------------------------------------------------------------------'''
+class StatusFigure(object):
+  def __init__(self, labels, title, randInit = False,
+               histLength = HIST_LENGTH, gui = False, layout = None,
+               orientationRow = None):
+    self.randInit    = randInit
+    self.orientationRow = orientationRow #Row of the buffer the cube shows
+    self.blitManager = None #Set by enableBlit
+    self.layout      = layout if layout is not None else Layout()
+    self.panels      = self.layout.panels() #Panels built, see monitor.layout
+
+    print('[Info   ] Initializing figure/subplots')
+
+    #Background style of figure
+    style.use(PLOT_STYLE)
+
+    #Set default matplotlib artist values
+    mpl.rc(('text', 'xtick', 'ytick'), color = LIGHT_GREEN)
+    mpl.rc(('lines', 'grid'), color = DARK_GREEN)
+    mpl.rc('axes', edgecolor = LIGHT_GREEN, titlesize = TITLE_SIZE)
+    mpl.rc('font', size = FONT_SIZE)
+    mpl.rc('grid', linestyle = ':')
+
+    #Create figure with 16:8 (width:height) ratio unless layout sizes it
+    size = self.layout.size or (FIG_WIDTH, FIG_HEIGHT)
+    if gui:
+      #pyplot picks a GUI backend and manages the window
+      import matplotlib.pyplot as plt
+      self.fig = plt.figure(figsize = size, dpi = DPI_DISPLAY)
+      self.fig.canvas.set_window_title(FIG_NAME)
+    else:
+      from matplotlib.backends.backend_agg import FigureCanvasAgg
+      self.fig = Figure(figsize = size, dpi = DPI_DISPLAY)
+      FigureCanvasAgg(self.fig)
+
+    #Set title of figure
+    self.fig.suptitle(title)
+
+    #Create enabled subplots on the layout's grid, None for the rest
+    grid = GridSpec(*self.layout.grid)
+    self.ax1 = self._addSubplot(grid, 'polar', polar = True)
+    self.ax2 = self._addSubplot(grid, 'orientation', projection = '3d')
+    self.ax3 = self._addSubplot(grid, 'heatmap')
+    self.ax4 = self._addSubplot(grid, 'movement')
+    self.ax5 = self._addSubplot(grid, 'status')
+    self.fig.tight_layout(pad = 2)
+
+    if 'polar' in self.panels:
+      self._initPolar()
+    if 'orientation' in self.panels:
+      self._initOrientation()
+    if 'heatmap' in self.panels:
+      self._initHeatmap()
+    if 'movement' in self.panels:
+      self._initMovement(histLength)
+    if 'status' in self.panels:
+      self._initStatus(labels)
+
+    #Polar and movement axes grow immediately but shrink only after
+    #SCALE_DWELL
+    self.polarScaler    = AutoScaler(SCALE_DWELL / 1000.0)
+    self.movementScaler = AutoScaler(SCALE_DWELL / 1000.0)
+
+    print('[Info   ] Figure init successful')
+
+  #Subplot of panel at its place in grid, None if layout leaves it out
+  def _addSubplot(self, grid, panel, **kwargs):
+    if panel not in self.panels:
+      return None
+    if kwargs.get('projection') == '3d':
+      #Registers the 3d projection, only loaded when it is used
+      from mpl_toolkits.mplot3d import Axes3D
+    row, col, rowspan, colspan = self.layout.placements[panel]
+    return self.fig.add_subplot(grid[row:row + rowspan, col:col + colspan],
+                                **kwargs)
+
+  #Hide tick marks, and tick labels too if labels is False
+  def _hideTicks(self, ax, labels = True):
+    ax.tick_params(axis = 'both', which = 'both', bottom = 'off', top = 'off',
+                   left = 'off', right = 'off')
+    if not labels:
+      ax.tick_params(labelbottom = 'off', labelleft = 'off')
+
+  '''[Init Polar Targets]---------------------------------------------------'''
+  def _initPolar(self):
+    ax1 = self.ax1
+    self.cvfMark = np.empty(3, dtype = object)
+    self.cvfText = np.empty(3, dtype = object)
+
+    #Polar target marks and text
+    for i in range(3):
+      self.cvfMark[i], = ax1.plot(0, 0, marker = 'o', c = DARK_RED,
+                                  markersize = 10)
+      self.cvfText[i] = ax1.text(0, 0, '',
+                 bbox = dict(facecolor = DARK_GREEN, alpha = 0.3), color = 'w')
+
+    self.cvdMark, = ax1.plot(0, 0, marker = 'o', c = DARK_RED,
+                             markersize = 10)
+    self.cvdText = ax1.text(0, 0, '',
+                 bbox = dict(facecolor = DARK_GREEN, alpha = 0.3), color = 'w')
+
+    self.sonarMark, = ax1.plot(0, 0, marker = 'D', c = DARK_RED,
+                               markersize = 10)
+    self.sonarText = ax1.text(0, 0, '',
+                 bbox = dict(facecolor = DARK_GREEN, alpha = 0.3), color = 'w')
+
+    #Set subplot title
+    ax1.set_title('Targets')
+
+    #Set label locations appropriately
+    ax1.set_theta_zero_location("N")
+    ax1.set_theta_direction(-1)
+
+    #Format ticks and labels
+    ax1.set_thetagrids(np.linspace(0, 360, NUM_PL_LINES, endpoint = False),
+                       frac = 1.05)
+    ax1.set_rlabel_position(90)
+
+    #Make ygridlines more visible (circular lines)
+    for line in ax1.get_ygridlines():
+      line.set_color(LIGHT_GREEN)
+
+  '''[Init Orientation]-----------------------------------------------------'''
+  def _initOrientation(self):
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+    ax2 = self.ax2
+
+    #Cube for orientation viewer, unrotated (x, y, z) of each point in path
+    cube = np.zeros((3, CUBE_POINTS))
+    cube[0] = [-1, -1, -1, 1,  1, -1, -1,  1,  1, -1, -1, -1,  1,  1,  1,  1]
+    cube[1] = [-1, -1,  1, 1,  1,  1, -1, -1, -1, -1,  1,  1,  1, -1, -1,  1]
+    cube[2] = [-1,  1,  1, 1, -1, -1, -1, -1,  1,  1,  1, -1, -1, -1,  1,  1]
+    self.cubePoints = cube.T.copy()
+
+    #Arrow for locating front face of cube
+    ca = np.zeros((3, ARROW_POINTS))
+    ca[0] = [0, 2, 1.75,  1.75, 2, 1.75,  1.75, 2]
+    ca[1] = [0, 0, 0.25, -0.25, 0,    0,     0, 0]
+    ca[2] = [0, 0,    0,     0, 0, 0.25, -0.25, 0]
+    self.arrowPoints = ca.T.copy()
+
+    #Rotated points, refilled in place and drawn by persistent line
+    #collections
+    self.cubeRotated  = self.cubePoints.copy()
+    self.arrowRotated = self.arrowPoints.copy()
+    self.cubeLines = Line3DCollection([self.cubeRotated], colors = LIGHT_GREEN)
+    self.cubeArrow = Line3DCollection([self.arrowRotated],
+                                      colors = LIGHT_YELLOW)
+    ax2.add_collection3d(self.cubeLines)
+    ax2.add_collection3d(self.cubeArrow)
+
+    #Collections don't autoscale, fix limits to fit the arrow in any rotation
+    ax2.set_xlim(-2, 2)
+    ax2.set_ylim(-2, 2)
+    ax2.set_zlim(-2, 2)
+
+    #Set subplot title
+    ax2.set_title('Orientation')
+
+    #Enable grid
+    ax2.grid(b = False)
+
+    #Set color of backgrounds
+    ax2.w_xaxis.set_pane_color((0, 0.075, 0, 1))
+    ax2.w_yaxis.set_pane_color((0, 0.075, 0, 1))
+    ax2.w_zaxis.set_pane_color((0, 0.125, 0, 1))
+
+    #Set color of axis lines
+    ax2.w_xaxis.line.set_color(LIGHT_GREEN)
+    ax2.w_yaxis.line.set_color(LIGHT_GREEN)
+    ax2.w_zaxis.line.set_color(LIGHT_GREEN)
+
+    #Set tick lines
+    ax2.set_xticks([])
+    ax2.set_yticks([])
+    ax2.set_zticks([])
+    self._hideTicks(ax2, labels = False)
+
+    #Set green axis labels
+    ax2.set_xlabel('X axis', color = LIGHT_GREEN)
+    ax2.set_ylabel('Y axis', color = LIGHT_GREEN)
+    ax2.set_zlabel('Z axis', color = LIGHT_GREEN)
+
+  '''[Init Heatmap]---------------------------------------------------------'''
+  def _initHeatmap(self):
+    ax3 = self.ax3
+
+    #Init thruster heatmap
+    self.heatmap = ax3.imshow(np.random.uniform(size = (3, 4)),
+                              cmap = 'RdBu', interpolation = 'nearest')
+
+    if not self.randInit:
+      self.heatmap.set_array(np.zeros((3, 4)))
+
+    #Set subplot title
+    ax3.set_title('Thruster Heatmap')
+
+    #Set ticks to properly extract parts of data
+    ax3.set_xticks([0, 1, 2, 3])
+    ax3.set_yticks([0, 1, 2])
+    self._hideTicks(ax3)
+
+    #Label ticks so they correspond to motors
+    ax3.set_xticklabels(['1', '2', '3', '4'])
+    ax3.set_yticklabels(['X', 'Y', 'Z'])
+
+  '''[Init Movement]--------------------------------------------------------'''
+  def _initMovement(self, histLength):
+    ax4 = self.ax4
+
+    #Past ax4 data to plot, px py pz vx vy vz vt ax ay az at
+    self.setHistLength(histLength)
+    self.moveSample = np.zeros(NUM_MV_LINES) #Latest sample added to dataHist
+
+    #Init movement data
+    if self.randInit:
+      initHist = np.zeros((NUM_MV_LINES, histLength))
+      for j in range(NUM_MV_LINES):
+        initHist[j][max(histLength - 1 - 5 * j, 1)] = max(2 * j, 1)
+      self.dataHist.reset(initHist)
+
+    #Initialize position graph plots
+    self.mLines = [ax4.plot([], '-', color = MOVE_COLORS[j])[0]
+                   for j in range(NUM_MV_LINES)]
+
+    #Latest value of each plot, shown in place of a legend
+    self.moveReadout = Readout(ax4, MOVE_LABELS, MOVE_COLORS)
+
+    #Set subplot title
+    ax4.set_title('Movement')
+
+    #Enable grid
+    ax4.grid(True)
+
+    if not self.randInit:
+      ax4.set_yticks(np.linspace(-1, 1, 5))
+      ax4.set_ylim(-1, 1)
+
+  '''[Init Status]----------------------------------------------------------'''
+  def _initStatus(self, labels):
+    ax5 = self.ax5
+
+    #Init strings to display over plot
+    self.statusFormat = 'BUFFER STATUS---------------Hz-------Age\n' + \
+                        ''.join('{:<14}: {{:<5}} {{:>8}} {{:>9}}\n'.format(
+                                label) for label in labels) + \
+                        '\nKill Switch   : {}'
+    self.status            = ax5.text(0.05, 0.55, 'Loading')
+    self.debugStatusMaster = ax5.text(0.05, 0.3 , '')
+    self.debugStatusNav    = ax5.text(0.05, 0.05, '')
+    self.timingText        = ax5.text(0.05, 0.02, '') #Space of debug text
+
+    for text in (self.status, self.debugStatusMaster, self.debugStatusNav,
+                 self.timingText):
+      text.set_family('monospace')
+
+    #Set subplot title
+    ax5.set_title('Status')
+    self._hideTicks(ax5, labels = False)
+
+  #Keep length samples of movement history, dropping what was kept before,
+  #and scale the x axis to fit it
+  def setHistLength(self, length):
+    self.dataHist = RingBuffer(NUM_MV_LINES, length)
+    self.moveX    = np.linspace(0, length - 1, length)
+
+    self.ax4.set_xticks(np.linspace(0, length, 11))
+    self.ax4.set_xlim(0, length)
+    if self.blitManager is not None:
+      self.blitManager.invalidate()
+
+  #Redraw only data artists over a cached background from now on
+  def enableBlit(self):
+    print('[Info   ] Blitting enabled')
+    self.blitManager = BlitManager(self.fig.canvas, self.artists())
+
+  #Every artist of enabled panels updated per frame, the rest is background
+  #when blitting
+  def artists(self):
+    artists = []
+    if 'polar' in self.panels:
+      artists += list(self.cvfMark) + [self.cvdMark, self.sonarMark] + \
+                 list(self.cvfText) + [self.cvdText, self.sonarText]
+    if 'orientation' in self.panels:
+      artists += [self.cubeLines, self.cubeArrow]
+    if 'heatmap' in self.panels:
+      artists += [self.heatmap]
+    if 'movement' in self.panels:
+      artists += self.mLines + self.moveReadout.artists()
+    if 'status' in self.panels:
+      artists += [self.status, self.debugStatusMaster, self.debugStatusNav,
+                  self.timingText]
+    return artists
+
+  #Draw the canvas now, only the changed artists when blitting
+  def draw(self):
+    if self.blitManager is not None:
+      self.blitManager.update()
+    else:
+      self.fig.canvas.draw()
+
+  '''setYRange-----------------------------------------------------------------
+  Fits y limits and ticks of ax to data from ymin to ymax using its autoscaler,
+  only touching the axis when the autoscaler picks new limits
+  --------------------------------------------------------------------------'''
+  def setYRange(self, ax, scaler, ymin, ymax):
+    if not scaler.update(ymin, ymax):
+      return
+
+    ax.set_yticks(scaler.ticks)
+    ax.set_ylim(scaler.limits)
+
+    #Ticks are part of the cached background, so it must be redrawn
+    if self.blitManager is not None:
+      self.blitManager.invalidate()
+
+  '''updatePolar---------------------------------------------------------------
+  Updates polar targets subplot
+  --------------------------------------------------------------------------'''
+  def updatePolar(self, data):
+    cvforwardData = data.cvforward
+
+    #Find max radius to adjust scale/ticks
+    maxR = 0
+    for j in range(3):
+      polarR = pow(pow(cvforwardData[j][0], 2) +
+                   pow(cvforwardData[j][1], 2), 1/2)
+
+      if polarR > maxR:
+        maxR = polarR
+
+      #Prevent crashes
+      if cvforwardData[j][0] != 0:
+        polarT = np.arctan(cvforwardData[j][1] / cvforwardData[j][0])
+      else:
+        polarT = np.pi / 2
+
+      #Update CV forward data
+      self.cvfMark[j].set_data(polarT, polarR)
+      self.cvfMark[j].set_color((1, cvforwardData[j][2] / -10, 0, 1))
+      self.cvfMark[j].set_markersize(20 - cvforwardData[j][3] * 5 / 128)
+
+      #Update CV forward text
+      self.cvfText[j].set_position((polarT, polarR))
+      self.cvfText[j].set_text('CVForw\nx:{0:5.3f}\n'\
+                               'y:{1:5.3f}\nz:{2:5.3f}\nc:{3}'.format(
+                               cvforwardData[j][0], cvforwardData[j][1],
+                               cvforwardData[j][2], cvforwardData[j][3]))
+
+    #Update CV down and sonar targets
+    maxR = max(maxR, self._placeTarget(self.cvdMark, self.cvdText, 'CVDown',
+                                       data.cvdown))
+    maxR = max(maxR, self._placeTarget(self.sonarMark, self.sonarText,
+                                       'Sonar', data.sonar))
+
+    #Adjust scale of ax1 to fit data nicely
+    if maxR != 0:
+      self.setYRange(self.ax1, self.polarScaler, 0, maxR * 6 / 5)
+
+  #Move mark and text to a single target location, returns its radius
+  def _placeTarget(self, mark, text, label, target):
+    polarR = pow(pow(target[0], 2) + pow(target[1], 2), 1/2)
+
+    #Prevent crashes
+    if target[0] != 0:
+      polarT = np.arctan(target[1] / target[0])
+    else:
+      polarT = np.pi / 2
+
+    mark.set_data(polarT, polarR)
+    mark.set_color((1, target[2] / -20 + 0.5, 0, 1))
+    mark.set_markersize(20 - target[3] * 5 / 128)
+
+    text.set_position((polarT, polarR))
+    text.set_text('{0}\nx:{1:5.3f}\ny:{2:5.3f}\nz:{3:5.3f}\nc:{4}'.format(
+                  label, target[0], target[1], target[2], target[3]))
+    return polarR
+
+  #Whether the orientation buffer is online, late or stale keep the last pose
+  def orientationLive(self, data):
+    if self.orientationRow is None:
+      return True
+    return data.statusStrings[self.orientationRow] in ('Up  ', 'Late',
+                                                       'Stale')
+
+  '''updateOrientation---------------------------------------------------------
+  Rotates orientation cube to latest quaternion
+  --------------------------------------------------------------------------'''
+  def updateOrientation(self, data):
+    #Only rotate model if stream is online
+    if self.orientationLive(data):
+      quat = tuple(data.orientation)
+    else:
+      #Default quaternion results in no rotation
+      quat = (1, 0, 0, 0)
+
+    #Apply transformation to all points of cube and front facing arrow at once
+    qv_mult_batch(quat, self.cubePoints, out = self.cubeRotated)
+    qv_mult_batch(quat, self.arrowPoints, out = self.arrowRotated)
+
+    #Point existing line collections at the rotated points
+    self.cubeLines.set_segments([self.cubeRotated])
+    self.cubeArrow.set_segments([self.arrowRotated])
+
+  '''updateHeatmap-------------------------------------------------------------
+  Updates thruster heatmap subplot
+  --------------------------------------------------------------------------'''
+  def updateHeatmap(self, data):
+    thrusterData = data.thruster
+
+    #Map data to heatmap
+    heatArray = [[thrusterData[1][0], thrusterData[1][1], 0, 0],
+                 [thrusterData[1][2], thrusterData[1][3], 0, 0],
+                 [thrusterData[0][0], thrusterData[0][1],
+                  thrusterData[0][2], thrusterData[0][3]]]
+
+    #Update motor heatmap
+    self.heatmap.set_array(heatArray)
+
+  '''updateMovement------------------------------------------------------------
+  Adds latest movement data to history and updates movement subplot
+  --------------------------------------------------------------------------'''
+  def updateMovement(self, data):
+    movementData = data.movement
+    moveSample   = self.moveSample
+
+    #Build latest sample, totals are magnitudes of velocity/acceleration
+    moveSample[0:3]  = movementData[0][:3]
+    moveSample[3:6]  = movementData[1][:3]
+    moveSample[6]    = np.sqrt(np.dot(movementData[1][:3], movementData[1][:3]))
+    moveSample[7:10] = movementData[2][:3]
+    moveSample[10]   = np.sqrt(np.dot(movementData[2][:3], movementData[2][:3]))
+
+    #Transfer data into data history
+    self.dataHist.append(moveSample)
+
+    #Update data for each plot
+    history = self.dataHist.view()
+    for j in range(NUM_MV_LINES):
+      self.mLines[j].set_data(self.moveX, history[j])
+
+    #Determine highest value to scale y axis properly
+    ymax = self.dataHist.max()
+    ymin = self.dataHist.min()
+
+    #Only if data results in a different max/min, adjust scale
+    if ymin != ymax:
+      self.setYRange(self.ax4, self.movementScaler, ymin,
+                     ymax + (ymax - ymin) / 5)
+
+    #Update readout with latest data values
+    self.moveReadout.update(moveSample)
+
+  '''updateStatus--------------------------------------------------------------
+  Updates buffer status text, with how often each buffer changes and how long
+  ago it last did
+  --------------------------------------------------------------------------'''
+  def updateStatus(self, data):
+    fields = []
+    for i in range(len(data.statusStrings)):
+      if np.isnan(data.ages[i]):
+        fields += [str(data.statusStrings[i]), '-', '-']
+      else:
+        fields += [str(data.statusStrings[i]), '{:.1f}'.format(data.rates[i]),
+                   '{:.1f}s'.format(data.ages[i])]
+    self.status.set_text(self.statusFormat.format(
+                         *(fields + [data.status[0]])))
+
+  '''updateDebug---------------------------------------------------------------
+  Updates buffer debug text
+  --------------------------------------------------------------------------'''
+  def updateDebug(self, data):
+    control = np.round(data.masterControl, 3)
+    nav     = np.round(data.nav, 3)
+
+    self.debugStatusMaster.set_text(
+         'BUFFER DEBUG----------------------------\n' \
+         '[Master Control]\n' \
+         'Ang X: vel: {} pos1: {} pos2: {}\n' \
+         'Ang Y: vel: {} pos1: {} pos2: {}\n' \
+         'Ang Z: vel: {} pos1: {} pos2: {}\n' \
+         'Lin X: vel: {} pos1: {} pos2: {}\n' \
+         'Lin Y: vel: {} pos1: {} pos2: {}\n' \
+         'Lin Z: vel: {} pos1: {} pos2: {}\n' \
+         'Mode : {}'.format(*(control[0:2].ravel().tolist() +
+                              [control[2][0][0]])))
+
+    self.debugStatusNav.set_text('[Nav Buffers]\n' \
+         'Lin ForcX: {} ForeY: {} ForcZ: {}\n' \
+         'Lin TorqX: {} TorqY: {} TorqZ: {}\n' \
+         'Ang ForcX: {} ForeY: {} ForcZ: {}\n' \
+         'Ang TorqX: {} TorqY: {} TorqZ: {}\n'.format(*nav.ravel().tolist()))
+
+  #Show frame timing summary text in the status panel
+  def updateTiming(self, summary):
+    self.timingText.set_text(summary)
@@ -0,0 +1,113 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : headless.py
+   Description: Runs the monitor without a display. Frames are rendered by
+                the Agg canvas into its RGBA buffer, which is reused every
+                frame, and written out as PNGs or as an MJPEG stream.
+---*-----------------------------------------------------------------------*'''
+import os, sys, time
+import numpy as np
+import matplotlib.image as mpimg
+
+'''FrameWriter-----------------------------------------------------------------
+Writes the canvas' current RGBA buffer to path, which is one of
+  -            MJPEG stream to stdout
+  *.mjpeg      MJPEG stream to a file or named pipe (also *.mjpg)
+  *{}*.png     Numbered PNG per frame, e.g. frames/{:05d}.png
+  *.png        Single PNG replaced every frame
+----------------------------------------------------------------------------'''
+class FrameWriter(object):
+  def __init__(self, canvas, path, quality = 80):
+    self.canvas  = canvas
+    self.path    = path
+    self.quality = quality #JPEG quality of MJPEG frames
+    self.frame   = 0       #Number of frames written
+    self.last    = None    #Last encoded MJPEG frame, resent if unchanged
+    self.stream  = None
+
+    if path == '-':
+      #Real stdout, even if sys.stdout was pointed elsewhere for logging
+      self.stream = sys.__stdout__.buffer
+    elif path.endswith('.mjpeg') or path.endswith('.mjpg'):
+      self.stream = open(path, 'wb')
+
+    if self.stream is not None:
+      #Only MJPEG needs Pillow, so only require it here
+      try:
+        from PIL import Image
+      except ImportError:
+        raise ImportError('MJPEG output requires Pillow (pip install pillow)')
+      self.image = Image
+
+  #RGBA pixels of last draw, a view of the canvas' own buffer, not a copy
+  def pixels(self):
+    return np.asarray(self.canvas.buffer_rgba())
+
+  #Write current frame, changed is False if nothing was redrawn since last
+  def write(self, changed = True):
+    if self.stream is not None:
+      self._writeMJPEG(changed)
+    elif '{' in self.path:
+      mpimg.imsave(self.path.format(self.frame), self.pixels())
+    elif changed or self.frame == 0:
+      #Write beside the file then rename so readers never see half a frame
+      root, ext = os.path.splitext(self.path)
+      temp = root + '.tmp' + ext
+      mpimg.imsave(temp, self.pixels())
+      os.replace(temp, self.path)
+    self.frame += 1
+
+  def close(self):
+    if self.stream is not None and self.stream is not sys.__stdout__.buffer:
+      self.stream.close()
+
+  def _writeMJPEG(self, changed):
+    if changed or self.last is None:
+      pixels = self.pixels()
+      height, width = pixels.shape[:2]
+      image = self.image.frombuffer('RGBA', (width, height), pixels, 'raw',
+                                    'RGBA', 0, 1).convert('RGB')
+      jpeg = _BytesSink()
+      image.save(jpeg, 'JPEG', quality = self.quality)
+      self.last = b''.join(jpeg.chunks)
+    self.stream.write(self.last)
+    self.stream.flush()
+
+#Minimal writable file object collecting what Pillow writes
+class _BytesSink(object):
+  def __init__(self):
+    self.chunks = []
+
+  def write(self, data):
+    self.chunks.append(bytes(data))
+    return len(data)
+
+  def flush(self):
+    pass
+
+'''runHeadless-----------------------------------------------------------------
+Calls update() and writes a frame fps times a second, or as fast as frames
+render if fps is 0, until frames have been written, or forever if frames is
+None. update returns whether it redrew
+----------------------------------------------------------------------------'''
+def runHeadless(update, writer, fps, frames = None):
+  period   = 1.0 / fps if fps > 0 else 0
+  nextTime = time.monotonic()
+  try:
+    while frames is None or writer.frame < frames:
+      writer.write(update())
+      if period == 0:
+        continue
+
+      #Hold target frame rate, dropping the wait if rendering fell behind
+      nextTime += period
+      wait = nextTime - time.monotonic()
+      if wait > 0:
+        time.sleep(wait)
+      else:
+        nextTime = time.monotonic()
+  except KeyboardInterrupt:
+    pass
+  finally:
+    writer.close()
@@ -0,0 +1,109 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : layout.py
+   Description: Which panels the figure has and where each sits on its grid.
+                Panels left out of a layout are never built, drawn or
+                updated, and buffers only they display are not decoded, so a
+                small layout makes for a much cheaper monitor.
+
+   Layout spec: comma separated (or one per line in a file, # comments)
+                  <panel>:<row>:<col>:<rowspan>:<colspan>
+                  grid:<rows>:<cols>        (default 6:12)
+                  size:<width>:<height>     (inches, default 16:8)
+                Panels given by name alone are placed side by side in one
+                row. Panels are polar, orientation, heatmap, movement, status
+---*-----------------------------------------------------------------------*'''
+import os
+
+PANELS = ['polar', 'orientation', 'heatmap', 'movement', 'status']
+
+#Default layout, (panel, row, col, rowspan, colspan) on a 6 row 12 col grid
+GRID = (6, 12)
+DEFAULT_PLACEMENTS = [('polar',       0, 0, 6, 6),
+                      ('orientation', 0, 6, 3, 3),
+                      ('heatmap',     0, 9, 2, 3),
+                      ('movement',    3, 6, 3, 3),
+                      ('status',      2, 9, 4, 3)]
+
+'''Layout----------------------------------------------------------------------
+Grid of the figure and (row, col, rowspan, colspan) of each enabled panel.
+size is the figure size in inches, None for the figure's default
+----------------------------------------------------------------------------'''
+class Layout(object):
+  def __init__(self, placements = DEFAULT_PLACEMENTS, grid = GRID,
+               size = None):
+    self.grid = grid
+    self.size = size
+    self.placements = dict((placement[0], placement[1:])
+                           for placement in placements)
+
+  def enabled(self, panel):
+    return panel in self.placements
+
+  #Enabled panels in PANELS order
+  def panels(self):
+    return [panel for panel in PANELS if panel in self.placements]
+
+  #Only decode buffers displayed by an enabled panel, the rest are still
+  #polled so the status panel can show whether they are up
+  def skipDecoding(self, table):
+    for entry in table:
+      entry.decoded = self.enabled(entry.panel)
+
+'''parseLayout-----------------------------------------------------------------
+Layout from spec, either a layout file or the spec itself. Raises ValueError
+describing the first bad item
+----------------------------------------------------------------------------'''
+def parseLayout(spec):
+  if os.path.isfile(spec):
+    with open(spec) as layoutFile:
+      items = []
+      for line in layoutFile:
+        items += line.split('#')[0].replace(',', ' ').split()
+  else:
+    items = [item.strip() for item in spec.split(',') if item.strip()]
+
+  grid  = None
+  size  = None
+  named = []  #Panels given without a placement
+  placements = []
+  for item in items:
+    fields = item.split(':')
+    key = fields[0]
+    try:
+      if key == 'grid' and len(fields) == 3:
+        grid = (int(fields[1]), int(fields[2]))
+      elif key == 'size' and len(fields) == 3:
+        size = (float(fields[1]), float(fields[2]))
+      elif key in PANELS and len(fields) == 1:
+        named.append(key)
+      elif key in PANELS and len(fields) == 5:
+        placements.append(tuple([key] + [int(field)
+                                         for field in fields[1:]]))
+      else:
+        raise ValueError
+    except ValueError:
+      raise ValueError('Bad layout item \'{}\''.format(item))
+
+  if named and placements:
+    raise ValueError('Layout panels must all have placements or none')
+  if named:
+    grid = (1, len(named))
+    placements = [(named[j], 0, j, 1, 1) for j in range(len(named))]
+  if not placements:
+    raise ValueError('Layout has no panels')
+  if grid is None:
+    grid = GRID
+
+  seen = set()
+  for panel, row, col, rowspan, colspan in placements:
+    if panel in seen:
+      raise ValueError('Panel {} placed twice'.format(panel))
+    seen.add(panel)
+    if row < 0 or col < 0 or rowspan < 1 or colspan < 1 or \
+       row + rowspan > grid[0] or col + colspan > grid[1]:
+      raise ValueError('Panel {} does not fit in a {}x{} grid'.format(
+                       panel, grid[0], grid[1]))
+
+  return Layout(placements, grid, size)
@@ -0,0 +1,240 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : localdsm.py
+   Description: Pure Python stand-in for DSM on one machine. Buffers are small
+                shared memory files (in /dev/shm by default) written by a
+                Publisher and read by a Client with the same calls statusmon
+                makes on pydsm.Client, so the live path can be exercised and
+                load tested without building DSMServer.
+
+   Usage      : python3 -m monitor.localdsm [-d] <dir> [-r] <hz> [-t] <s>
+---*-----------------------------------------------------------------------*'''
+import os, sys, getopt, math, mmap, struct, time
+from Constants import *
+from Navigation import Outputs
+from Sensor import Linear, Angular
+from Vision import Location, LocationArray
+from Serialization import Pack
+
+DEFAULT_DIR = '/dev/shm/statusmon-dsm' if os.path.isdir('/dev/shm') else \
+              os.path.join(os.path.expanduser('~'), '.statusmon-dsm')
+ACTIVE_TIMEOUT = 1.0 #Seconds since last publish a buffer still counts as up
+READ_RETRIES   = 1000 #Torn reads of a slot before giving up until next poll
+
+#Slot file layout: sequence, payload length, publish time, then payload.
+#Sequence is odd while a write is in progress
+SLOT_HEADER = struct.Struct('<IId')
+
+#Slot file holding buffer name on server serverId
+def slotPath(directory, name, serverId):
+  return os.path.join(directory, '{}_{}'.format(int(serverId), name))
+
+'''Publisher-------------------------------------------------------------------
+Writes buffers into slot files, creating them on first publish
+----------------------------------------------------------------------------'''
+class Publisher(object):
+  def __init__(self, directory = DEFAULT_DIR):
+    self.directory = directory
+    self.slots = {} #(name, server id) -> [mmap, sequence]
+    if not os.path.isdir(directory):
+      os.makedirs(directory)
+
+  def publish(self, name, serverId, contents):
+    key  = (name, int(serverId))
+    slot = self.slots.get(key)
+    if slot is None or len(slot[0]) != SLOT_HEADER.size + len(contents):
+      slot = [self._create(name, serverId, len(contents)), 0]
+      self.slots[key] = slot
+    data = slot[0]
+
+    #Seqlock write, readers retry if they see an odd or changed sequence
+    slot[1] += 1
+    SLOT_HEADER.pack_into(data, 0, slot[1], len(contents), time.monotonic())
+    data[SLOT_HEADER.size:] = contents
+    slot[1] += 1
+    struct.pack_into('<I', data, 0, slot[1])
+
+  def close(self):
+    for data, sequence in self.slots.values():
+      data.close()
+
+  def _create(self, name, serverId, size):
+    path = slotPath(self.directory, name, serverId)
+    temp = path + '.tmp'
+    with open(temp, 'wb') as slotFile:
+      slotFile.write(bytes(SLOT_HEADER.size + size))
+
+    #Rename into place so readers never map a file that is still growing
+    os.replace(temp, path)
+    with open(path, 'r+b') as slotFile:
+      return mmap.mmap(slotFile.fileno(), 0)
+
+'''Client----------------------------------------------------------------------
+Reads buffers written by a Publisher, mirroring the pydsm.Client calls used by
+statusmon. A buffer is active while its publisher keeps writing to it
+----------------------------------------------------------------------------'''
+class Client(object):
+  def __init__(self, serverId, clientId, ipc = True, directory = DEFAULT_DIR,
+               timeout = ACTIVE_TIMEOUT):
+    self.serverId  = serverId
+    self.clientId  = clientId
+    self.directory = directory
+    self.timeout   = timeout
+    self.slots     = {} #(name, server id) -> mmap, None until published
+
+  def registerRemoteBuffer(self, name, ip, serverId):
+    self.slots[(name, int(serverId))] = None
+    return True
+
+  #Latest contents of buffer and whether its publisher is still writing it
+  def getRemoteBufferContents(self, name, ip, serverId):
+    key  = (name, int(serverId))
+    data = self.slots[key]
+    if data is None:
+      data = self._open(name, serverId)
+      if data is None:
+        return b'', False
+      self.slots[key] = data
+
+    #Retry reads torn by a write, a publisher that died mid write leaves the
+    #sequence odd for good, so give up once the write is older than timeout
+    contents = None
+    for attempt in range(READ_RETRIES):
+      sequence, length, stamp = SLOT_HEADER.unpack_from(data, 0)
+      if sequence % 2 == 0:
+        read = data[SLOT_HEADER.size:SLOT_HEADER.size + length]
+        if struct.unpack_from('<I', data, 0)[0] == sequence:
+          contents = read
+          break
+      if time.monotonic() - stamp >= self.timeout:
+        break
+      time.sleep(0)
+
+    #Without a whole read the buffer counts as down until the next poll
+    active = contents is not None and time.monotonic() - stamp < self.timeout
+    if contents is None:
+      contents = b''
+    if not active:
+      #Publisher may have restarted with a new file, look again next time
+      data.close()
+      self.slots[key] = None
+    return contents, active
+
+  def _open(self, name, serverId):
+    try:
+      with open(slotPath(self.directory, name, serverId), 'rb') as slotFile:
+        return mmap.mmap(slotFile.fileno(), 0, access = mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):
+      return None
+
+'''Synthetic Data--------------------------------------------------------------
+Valid payloads of a sub moving on a slow circle and spinning about z while
+tracking targets, as a function of time t
+----------------------------------------------------------------------------'''
+def synthLinear(t):
+  linear = Linear()
+  linear.pos[:] = [3 * math.cos(t / 4), 3 * math.sin(t / 4), -1 - math.sin(t)]
+  linear.vel[:] = [-0.75 * math.sin(t / 4), 0.75 * math.cos(t / 4),
+                   -math.cos(t)]
+  linear.acc[:] = [-0.1875 * math.cos(t / 4), -0.1875 * math.sin(t / 4),
+                   math.sin(t)]
+  return Pack(linear)
+
+def synthAngular(t):
+  angular = Angular()
+  angle = t / 2
+  angular.pos[:] = [math.cos(angle / 2), 0, 0, math.sin(angle / 2)]
+  angular.vel[:] = [0, 0, 0.5]
+  return Pack(angular)
+
+def synthOutputs(t):
+  outputs = Outputs()
+  outputs.motors[:] = [math.sin(t + j * math.pi / 4) for j in range(8)]
+  return Pack(outputs)
+
+def _setLocation(location, t, phase):
+  location.x = 2 * math.cos(t / 3 + phase)
+  location.y = 2 * math.sin(t / 3 + phase)
+  location.z = -2 - math.sin(t / 5 + phase)
+  location.confidence = int(127 + 127 * math.sin(t + phase))
+
+def synthLocationArray(t):
+  locations = LocationArray()
+  for j in range(3):
+    _setLocation(locations.locations[j], t, j * 2 * math.pi / 3)
+  return Pack(locations)
+
+def synthLocation(phase):
+  def synth(t):
+    location = Location()
+    _setLocation(location, t, phase)
+    return Pack(location)
+  return synth
+
+#Buffers published by the synthetic publisher, (name, server id, Hz, synth)
+SYNTH_TABLE = [
+  (SENSORS_LINEAR,  SENSOR_SERVER_ID,          50, synthLinear),
+  (SENSORS_ANGULAR, SENSOR_SERVER_ID,          50, synthAngular),
+  (MOTOR_OUTPUTS,   MOTOR_SERVER_ID,           20, synthOutputs),
+  (TARGET_LOCATION, FORWARD_VISION_SERVER_ID,  10, synthLocationArray),
+  (TARGET_LOCATION, DOWNWARD_VISION_SERVER_ID, 10, synthLocation(1.0)),
+  (TARGET_LOCATION, SONAR_SERVER_ID,           10, synthLocation(2.0))]
+
+'''runPublisher----------------------------------------------------------------
+Publishes SYNTH_TABLE at each buffer's rate, or every buffer at rate Hz if
+given, for duration seconds or forever
+----------------------------------------------------------------------------'''
+def runPublisher(publisher, rate = None, duration = None):
+  start = time.monotonic()
+  due   = [start] * len(SYNTH_TABLE)
+  while duration is None or time.monotonic() - start < duration:
+    now = time.monotonic()
+    for j in range(len(SYNTH_TABLE)):
+      name, serverId, hz, synth = SYNTH_TABLE[j]
+      if now >= due[j]:
+        publisher.publish(name, serverId, synth(now - start))
+        due[j] = max(due[j] + 1.0 / (rate or hz), now)
+    time.sleep(max(0, min(due) - time.monotonic()))
+
+'''Main------------------------------------------------------------------------
+Run the synthetic publisher until interrupted
+----------------------------------------------------------------------------'''
+if __name__ == '__main__':
+  usage = 'Usage: python3 -m monitor.localdsm [-d] <dir> [-r] <hz> [-t] <s> '\
+          '| [-h]\n'\
+          '  -d   Buffer Directory (default {})\n'\
+          '  -r   Publish Rate     (Hz for every buffer, default per buffer)\n'\
+          '  -t   Duration         (s, default forever)\n'\
+          '  -h   Show help'.format(DEFAULT_DIR)
+
+  try:
+    opts, args = getopt.getopt(sys.argv[1:], 'hd:r:t:')
+  except getopt.GetoptError as err:
+    print(err)
+    print(usage)
+    sys.exit(2)
+
+  directory = DEFAULT_DIR
+  rate      = None
+  duration  = None
+  for opt, arg in opts:
+    if opt == '-h':
+      print(usage)
+      sys.exit()
+    elif opt == '-d':
+      directory = arg
+    elif opt == '-r':
+      rate = float(arg)
+    elif opt == '-t':
+      duration = float(arg)
+
+  print('[Info   ] Publishing {} buffers to {}'.format(len(SYNTH_TABLE),
+                                                      directory))
+  publisher = Publisher(directory)
+  try:
+    runPublisher(publisher, rate, duration)
+  except KeyboardInterrupt:
+    pass
+  finally:
+    publisher.close()
@@ -0,0 +1,88 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : poller.py
+   Description: Polls DSM buffers on a background thread so slow or dead
+                remote buffers never stall drawing. The thread decodes into
+                its own MonitorData and publishes a snapshot when a poll
+                completes; the animation swaps the latest one in per frame,
+                along with the time polls spent on each stage since then.
+---*-----------------------------------------------------------------------*'''
+import threading, time
+from monitor.data import MonitorData
+
+'''Poller----------------------------------------------------------------------
+Runs poll(data, timer) on a daemon thread, with the poller as timer. poll
+returns seconds until it next has work, or None to wait the default delay.
+Polls fill a copy of initial if given, so data they don't touch keeps its
+initial values once swapped in
+----------------------------------------------------------------------------'''
+class Poller(object):
+  def __init__(self, poll, numBuffers, delay, initial = None):
+    self.poll  = poll                    #poll(data, timer) fills MonitorData
+    self.delay = delay                   #Longest wait between polls
+    self.back  = MonitorData(numBuffers) #Written only by the poll thread
+    self.latest = MonitorData(numBuffers) #Last completed poll
+    self.fresh = False                   #latest not yet swapped in
+    self.spent = {}                      #ns per stage of the poll running
+    self.spentLatest = {}                #ns per stage since last swap
+    self.lock  = threading.Lock()
+    self.stopped = threading.Event()
+    self.thread = threading.Thread(target = self._run, name = 'Poller')
+    self.thread.daemon = True
+
+    if initial is not None:
+      self.back.copyFrom(initial)
+      self.latest.copyFrom(initial)
+
+  def start(self):
+    self.thread.start()
+
+  def stop(self):
+    self.stopped.set()
+
+  #Wait for a stopped poller to finish its current poll, returns whether it
+  #did within timeout
+  def join(self, timeout = None):
+    self.thread.join(timeout)
+    return not self.thread.is_alive()
+
+  #Charge ns to stage of the poll running, called by poll
+  def add(self, stage, ns):
+    self.spent[stage] = self.spent.get(stage, 0) + ns
+
+  #Copy the latest snapshot into front and note time polls spent on each
+  #stage since the last swap to timer if given, returns False if nothing new
+  def swap(self, front, timer = None):
+    with self.lock:
+      if not self.fresh:
+        return False
+      front.copyFrom(self.latest)
+      spent = self.spentLatest
+      self.spentLatest = {}
+      self.fresh = False
+    if timer is not None:
+      for stage, ns in spent.items():
+        timer.note(stage, ns)
+    return True
+
+  def _run(self):
+    while not self.stopped.is_set():
+      start = time.monotonic()
+      wait  = None
+      self.spent = {}
+      try:
+        wait = self.poll(self.back, self)
+      except Exception as err:
+        print('[Error  ] Poll failed: {}'.format(err))
+      else:
+        with self.lock:
+          self.latest.copyFrom(self.back)
+          for stage, ns in self.spent.items():
+            self.spentLatest[stage] = self.spentLatest.get(stage, 0) + ns
+          self.fresh = True
+
+      #Keep a steady rate regardless of how long the poll took
+      if wait is None:
+        wait = self.delay - (time.monotonic() - start)
+      self.stopped.wait(min(max(0, wait), self.delay))
@@ -0,0 +1,46 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : readout.py
+   Description: Lightweight replacement for a legend that shows live values.
+                Its artists are created once and only their strings change,
+                so it is cheap to update every frame and can be blitted.
+---*-----------------------------------------------------------------------*'''
+from matplotlib.lines import Line2D
+
+'''Readout---------------------------------------------------------------------
+Column of colored swatches with fixed width label:value text next to them
+----------------------------------------------------------------------------'''
+class Readout(object):
+  def __init__(self, ax, labels, colors, x = 0.02, y = 0.97, spacing = 0.065,
+               fmt = '{}:{:>9.3f}'):
+    self.labels  = labels
+    self.fmt     = fmt
+    self.strings = [None] * len(labels) #Text currently shown per value
+    self.texts   = []                   #Text artists, redrawn every frame
+    self.swatches = []                  #Line artists, never change
+
+    for j in range(len(labels)):
+      lineY = y - j * spacing
+
+      #Swatch in line color, like a legend handle
+      swatch = Line2D([x, x + 0.05], [lineY, lineY], color = colors[j],
+                      linewidth = 2, transform = ax.transAxes)
+      ax.add_artist(swatch)
+      self.swatches.append(swatch)
+
+      text = ax.text(x + 0.07, lineY, '', transform = ax.transAxes,
+                     va = 'center', family = 'monospace')
+      self.texts.append(text)
+
+  #Show latest values, only touching text whose formatted string changed
+  def update(self, values):
+    for j in range(len(self.texts)):
+      string = self.fmt.format(self.labels[j], values[j])
+      if string != self.strings[j]:
+        self.strings[j] = string
+        self.texts[j].set_text(string)
+
+  #Artists to redraw when blitting
+  def artists(self):
+    return self.texts
@@ -0,0 +1,153 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : recorder.py
+   Description: Records every polled buffer to an append-only binary log.
+                Payloads are stored raw, so recording never decodes, and all
+                file writes and fsyncs happen on a background thread.
+---*-----------------------------------------------------------------------*'''
+import os, struct, threading, time
+try:
+  import queue
+except ImportError:
+  import Queue as queue
+
+'''Log Format------------------------------------------------------------------
+File header, then records. Every record is a length-prefixed body
+  header  magic, wall clock start, monotonic start  (LOG_HEADER)
+  record  body length, kind                          (RECORD_HEADER) + body
+
+Record kinds
+  RECORD_BUFFER  time, active, server id, name length (BUFFER_HEADER), name,
+                 raw buffer bytes
+  RECORD_INDEX   previous index offset, offset of first record it covers,
+                 first time, last time, buffer record count (INDEX_BODY).
+                 Written every INDEX_EVERY buffer records
+  RECORD_END     offset of last index (END_BODY), last record of a log that
+                 was closed cleanly, so readers can find the index from the
+                 end. Logs cut short by a crash are read by scanning instead
+----------------------------------------------------------------------------'''
+LOG_MAGIC     = b'SMONLOG1'
+LOG_HEADER    = struct.Struct('<8sdd')
+RECORD_HEADER = struct.Struct('<IB')
+BUFFER_HEADER = struct.Struct('<d?HB')
+INDEX_BODY    = struct.Struct('<qqddI')
+END_BODY      = struct.Struct('<q')
+
+RECORD_BUFFER = 1
+RECORD_INDEX  = 2
+RECORD_END    = 3
+
+INDEX_EVERY   = 1000 #Buffer records covered by each index record
+SYNC_INTERVAL = 1.0  #Seconds between fsyncs
+
+'''Recorder--------------------------------------------------------------------
+Appends buffer payloads to the log at path. record() only queues, a daemon
+thread batches queued records into single writes and fsyncs periodically
+----------------------------------------------------------------------------'''
+class Recorder(object):
+  def __init__(self, path, syncInterval = SYNC_INTERVAL,
+               indexEvery = INDEX_EVERY):
+    self.path         = path
+    self.syncInterval = syncInterval
+    self.indexEvery   = indexEvery
+    self.queue        = queue.Queue()
+    self.stopped      = threading.Event()
+    self.thread = threading.Thread(target = self._run, name = 'Recorder')
+    self.thread.daemon = True
+
+    #Index state, only touched by the recorder thread
+    self.lastIndex  = -1   #Offset of last index record, -1 if none yet
+    self.chunkStart = None #Offset of first record since last index
+    self.chunkFirst = 0.0  #Time of first record since last index
+    self.chunkLast  = 0.0  #Time of last record since last index
+    self.chunkCount = 0    #Buffer records since last index
+
+    self.file = open(path, 'wb')
+    self.file.write(LOG_HEADER.pack(LOG_MAGIC, time.time(), time.monotonic()))
+    self.offset = LOG_HEADER.size
+
+  def start(self):
+    self.thread.start()
+
+  #Queue one polled buffer, cheap enough to call from the poll loop
+  def record(self, name, serverId, timestamp, active, contents):
+    self.queue.put((name, serverId, timestamp, active, contents))
+
+  #Write everything queued, close the log cleanly and wait for the thread
+  def stop(self):
+    self.stopped.set()
+    self.thread.join()
+
+  def _run(self):
+    lastSync = time.monotonic()
+    while not self.stopped.is_set():
+      try:
+        batch = [self.queue.get(timeout = self.syncInterval)]
+      except queue.Empty:
+        batch = []
+
+      #Take everything else queued so it goes out in one write
+      while True:
+        try:
+          batch.append(self.queue.get_nowait())
+        except queue.Empty:
+          break
+      if batch:
+        self.file.write(self._pack(batch))
+
+      if time.monotonic() - lastSync >= self.syncInterval:
+        self._sync()
+        lastSync = time.monotonic()
+
+    #Drain what was queued before stop, then index and end the log
+    batch = []
+    while not self.queue.empty():
+      batch.append(self.queue.get_nowait())
+    chunks = [self._pack(batch)]
+    if self.chunkCount:
+      chunks.append(self._index())
+    chunks.append(self._packRecord(RECORD_END, END_BODY.pack(self.lastIndex)))
+    self.file.write(b''.join(chunks))
+    self._sync()
+    self.file.close()
+
+  #Pack queued records, adding index records as they fill up
+  def _pack(self, batch):
+    chunks = []
+    for name, serverId, timestamp, active, contents in batch:
+      if not isinstance(contents, bytes):
+        contents = bytes(contents)
+      name = name.encode('ascii')
+
+      if self.chunkCount == 0:
+        self.chunkStart = self.offset
+        self.chunkFirst = timestamp
+      self.chunkLast   = timestamp
+      self.chunkCount += 1
+
+      chunks.append(self._packRecord(RECORD_BUFFER,
+                      BUFFER_HEADER.pack(timestamp, active, int(serverId),
+                                         len(name)) + name + contents))
+      if self.chunkCount >= self.indexEvery:
+        chunks.append(self._index())
+    return b''.join(chunks)
+
+  #Index record covering records since the last one
+  def _index(self):
+    offset = self.offset
+    record = self._packRecord(RECORD_INDEX,
+                              INDEX_BODY.pack(self.lastIndex, self.chunkStart,
+                                              self.chunkFirst, self.chunkLast,
+                                              self.chunkCount))
+    self.lastIndex  = offset
+    self.chunkCount = 0
+    return record
+
+  def _packRecord(self, kind, body):
+    self.offset += RECORD_HEADER.size + len(body)
+    return RECORD_HEADER.pack(len(body), kind) + body
+
+  def _sync(self):
+    self.file.flush()
+    os.fsync(self.file.fileno())
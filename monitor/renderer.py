@@ -0,0 +1,100 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : renderer.py
+   Description: Draws frames of a StatusFigure from a data source. Each frame
+                acquires the latest data, updates only the subplots whose data
+                changed and redraws the canvas if anything did, timing every
+                stage. Drives both the GUI timer and headless output.
+---*-----------------------------------------------------------------------*'''
+import time
+from monitor.changes import ChangeTracker
+
+TIMING_REFRESH = 1000 #Millisecond delay between frame timing text updates
+AGE_REFRESH    = 1000 #Millisecond delay between buffer age/rate updates
+TIMING_STAGES  = ['acquire', 'fetch', 'decode', 'polar', 'orientation',
+                  'heatmap', 'movement', 'status',
+                  'draw'] #Timed stages of each frame
+
+'''Renderer--------------------------------------------------------------------
+Renders figure from source into data, one frame per update(), timed by timer
+(a FrameTimer over TIMING_STAGES). Debug shows debug text in place of timing.
+Only the figure's enabled panels are updated
+----------------------------------------------------------------------------'''
+class Renderer(object):
+  def __init__(self, figure, source, data, timer, debug = False):
+    self.figure  = figure
+    self.source  = source
+    self.data    = data
+    self.timer   = timer
+    self.debug   = debug
+    self.tracker = ChangeTracker() #Tracks which subplots need updating
+    self.statusShown = None        #Time status text was last updated
+
+  '''animate-------------------------------------------------------------------
+  Updates subplots of figure whose data changed since they were last drawn,
+  returns whether anything needs to be redrawn
+  --------------------------------------------------------------------------'''
+  def animate(self):
+    figure, data, timer, tracker = self.figure, self.data, self.timer, \
+                                   self.tracker
+    panels = figure.panels
+
+    #Grab latest data to plot as well as info on whether buffers are online
+    self.source.acquire(data, timer)
+    data.clampTargets()
+    timer.mark('acquire')
+
+    #Only update subplots whose data changed
+    changed = False
+    if 'polar' in panels and tracker.changed('polar', data.cvforward,
+                                             data.cvdown, data.sonar):
+      figure.updatePolar(data)
+      changed = True
+    timer.mark('polar')
+    if 'orientation' in panels and \
+       tracker.changed('orientation', data.orientation,
+                       figure.orientationLive(data)):
+      figure.updateOrientation(data)
+      changed = True
+    timer.mark('orientation')
+    if 'heatmap' in panels and tracker.changed('heatmap', data.thruster):
+      figure.updateHeatmap(data)
+      changed = True
+    timer.mark('heatmap')
+    if 'movement' in panels and tracker.changed('movement', data.movement):
+      figure.updateMovement(data)
+      changed = True
+    timer.mark('movement')
+    if 'status' in panels:
+      #Ages and rates change every poll, so only refresh them now and then
+      now = time.monotonic()
+      if tracker.changed('status', data.statusStrings, data.status[0]) or \
+         now - self.statusShown >= AGE_REFRESH / 1000.0:
+        figure.updateStatus(data)
+        self.statusShown = now
+        changed = True
+      if self.debug and tracker.changed('debug', data.masterControl,
+                                        data.nav):
+        figure.updateDebug(data)
+        changed = True
+      if not self.debug and timer.due(TIMING_REFRESH / 1000.0):
+        figure.updateTiming(timer.summary())
+        changed = True
+    timer.mark('status')
+
+    return changed
+
+  '''update--------------------------------------------------------------------
+  Animates figure, only redrawing the canvas when a subplot changed. Returns
+  whether it redrew
+  --------------------------------------------------------------------------'''
+  def update(self):
+    self.timer.start()
+    changed = self.animate()
+    if changed:
+      #Draw now rather than when idle so the draw stage can be timed
+      self.figure.draw()
+    self.timer.mark('draw')
+    self.timer.end()
+    return changed
@@ -0,0 +1,170 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : replay.py
+   Description: Plays back logs written by monitor.recorder. The log is
+                memory mapped and its index records are used to seek, so
+                jumping anywhere in a long dive only reads a few records.
+---*-----------------------------------------------------------------------*'''
+import bisect, mmap, time
+from monitor.buffers import ageBuffers, storeBuffer
+from monitor.recorder import LOG_MAGIC, LOG_HEADER, RECORD_HEADER, \
+                             BUFFER_HEADER, INDEX_BODY, END_BODY, \
+                             RECORD_BUFFER, RECORD_INDEX, RECORD_END, \
+                             INDEX_EVERY
+
+'''LogReader-------------------------------------------------------------------
+Random access to a recorded log. Chunks are (offset, first time, last time)
+of runs of buffer records, taken from the index or rebuilt by scanning logs
+that were not closed cleanly
+----------------------------------------------------------------------------'''
+class LogReader(object):
+  def __init__(self, path):
+    self.path = path
+    self.file = open(path, 'rb')
+    self.map  = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+
+    magic, self.wallStart, self.monoStart = LOG_HEADER.unpack_from(self.map)
+    if magic != LOG_MAGIC:
+      raise ValueError('{} is not a statusmon log'.format(path))
+
+    self.chunks = self._readIndex()
+    if self.chunks is None:
+      print('[Warning] {} was not closed cleanly, scanning it'.format(path))
+      self.chunks = self._scan()
+    self.starts = [chunk[1] for chunk in self.chunks] #Chunk first times
+
+    #Time span of log
+    self.start = self.chunks[0][1] if self.chunks else self.monoStart
+    self.end   = self.chunks[-1][2] if self.chunks else self.monoStart
+
+  def close(self):
+    self.map.close()
+    self.file.close()
+
+  #Buffer records from offset on as (offset, time, name, server id, active,
+  #contents), stopping at the end of the log or a record cut short
+  def records(self, offset = LOG_HEADER.size):
+    data = self.map
+    size = len(data)
+    while offset + RECORD_HEADER.size <= size:
+      length, kind = RECORD_HEADER.unpack_from(data, offset)
+      body = offset + RECORD_HEADER.size
+      if body + length > size:
+        return
+
+      if kind == RECORD_BUFFER:
+        timestamp, active, serverId, nameLen = \
+          BUFFER_HEADER.unpack_from(data, body)
+        nameStart = body + BUFFER_HEADER.size
+        name = data[nameStart:nameStart + nameLen].decode('ascii')
+        yield (offset, timestamp, name, serverId, active,
+               data[nameStart + nameLen:body + length])
+      offset = body + length
+
+  #Offset of the chunk that holds time t, or the one before it if before is
+  #set, so replaying from there catches up on every buffer
+  def seek(self, t, before = False):
+    if not self.chunks:
+      return LOG_HEADER.size
+    i = max(bisect.bisect_right(self.starts, t) - 1, 0)
+    if before:
+      i = max(i - 1, 0)
+    return self.chunks[i][0]
+
+  #Follow index records back from the end record, None if there is none
+  def _readIndex(self):
+    data = self.map
+    endStart = len(data) - END_BODY.size - RECORD_HEADER.size
+    if endStart < LOG_HEADER.size:
+      return None
+    length, kind = RECORD_HEADER.unpack_from(data, endStart)
+    if kind != RECORD_END or length != END_BODY.size:
+      return None
+
+    chunks = []
+    index, = END_BODY.unpack_from(data, endStart + RECORD_HEADER.size)
+    while index >= 0:
+      length, kind = RECORD_HEADER.unpack_from(data, index)
+      if kind != RECORD_INDEX:
+        return None
+      prev, start, first, last, count = \
+        INDEX_BODY.unpack_from(data, index + RECORD_HEADER.size)
+      chunks.append((start, first, last))
+      index = prev
+    chunks.reverse()
+    return chunks
+
+  #Rebuild chunks by reading every buffer record's header
+  def _scan(self):
+    chunks = []
+    count  = 0
+    for offset, timestamp, name, serverId, active, contents in self.records():
+      if count % INDEX_EVERY == 0:
+        chunks.append([offset, timestamp, timestamp])
+      chunks[-1][2] = timestamp
+      count += 1
+    return [tuple(chunk) for chunk in chunks]
+
+'''Replayer--------------------------------------------------------------------
+Feeds a log's buffers through the same decoding as live polling. speed is a
+multiple of real time, or 0 to advance step seconds of log per poll as fast
+as frames are drawn
+----------------------------------------------------------------------------'''
+class Replayer(object):
+  def __init__(self, reader, table, speed = 1.0, step = 1.0, debug = False):
+    self.reader = reader
+    self.speed  = speed
+    self.step   = step
+    self.debug  = debug
+    self.table  = table
+    self.done   = False #Reached end of log
+
+    #Row of table each (name, server id) decodes into
+    self.rows = {}
+    for i in range(len(table)):
+      self.rows[(table[i].name, int(table[i].serverId))] = i
+
+    self.seek(reader.start)
+
+  #Jump to log time t, replaying shortly before it so every buffer is current
+  def seek(self, t):
+    self.logTime  = t
+    self.logBase  = t
+    self.wallBase = time.monotonic()
+    self.done     = False
+    self.records  = self.reader.records(self.reader.seek(t, before = True))
+    self.pending  = next(self.records, None) #Next record to decode
+
+    #Payload changes seen elsewhere in the log would give wrong ages
+    for entry in self.table:
+      entry.resetTracking()
+
+  #Decode records up to the current log time into data, returns seconds
+  #until the next record is due
+  def poll(self, data):
+    if self.speed > 0:
+      self.logTime = self.logBase + \
+                     (time.monotonic() - self.wallBase) * self.speed
+    else:
+      self.logTime += self.step
+
+    while self.pending is not None and self.pending[1] <= self.logTime:
+      offset, timestamp, name, serverId, active, contents = self.pending
+      i = self.rows.get((name, serverId))
+      if i is not None:
+        storeBuffer(self.table, i, contents, active, self.debug, data,
+                    timestamp)
+      self.pending = next(self.records, None)
+
+    #Ages stop at the end of the log rather than growing after it
+    ageBuffers(self.table, data, min(self.logTime, self.reader.end))
+
+    if self.pending is None:
+      if not self.done:
+        print('[Info   ] Replay finished')
+        self.done = True
+      return None
+    if self.speed > 0:
+      return (self.pending[1] - self.logTime) / self.speed
+    return 0
@@ -0,0 +1,67 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : ringbuffer.py
+   Description: Fixed length history of several channels. Appending is O(1),
+                the ordered history is always available as a contiguous view,
+                and each channel's min/max is kept up to date as samples are
+                added and dropped.
+---*-----------------------------------------------------------------------*'''
+import numpy as np
+
+'''RingBuffer------------------------------------------------------------------
+History of length samples for each of channels, starts filled with zeros
+----------------------------------------------------------------------------'''
+class RingBuffer(object):
+  def __init__(self, channels, length):
+    self.channels = channels
+    self.length   = length
+
+    #Every sample is written twice, length apart, so the last length samples
+    #are always contiguous starting at pos
+    self.buf  = np.zeros((channels, 2 * length))
+    self.pos  = 0
+    self.mins = np.zeros(channels)
+    self.maxs = np.zeros(channels)
+
+  #Replace whole history with array of shape (channels, length), oldest first
+  def reset(self, history):
+    self.buf[:, :self.length] = history
+    self.buf[:, self.length:] = history
+    self.pos = 0
+    self.mins[:] = self.buf[:, :self.length].min(axis = 1)
+    self.maxs[:] = self.buf[:, :self.length].max(axis = 1)
+
+  #Add one sample per channel, dropping the oldest
+  def append(self, sample):
+    pos = self.pos
+    evicted = self.buf[:, pos].copy()
+    self.buf[:, pos] = sample
+    self.buf[:, pos + self.length] = sample
+    self.pos = (pos + 1) % self.length
+
+    #A channel only needs rescanning if it just dropped its only extreme
+    rescanMin = (evicted == self.mins) & (self.buf[:, pos] > evicted)
+    rescanMax = (evicted == self.maxs) & (self.buf[:, pos] < evicted)
+    np.minimum(self.mins, self.buf[:, pos], out = self.mins)
+    np.maximum(self.maxs, self.buf[:, pos], out = self.maxs)
+    if rescanMin.any():
+      self.mins[rescanMin] = self.view()[rescanMin].min(axis = 1)
+    if rescanMax.any():
+      self.maxs[rescanMax] = self.view()[rescanMax].max(axis = 1)
+
+  #Ordered history of shape (channels, length), oldest first, without copying
+  def view(self):
+    return self.buf[:, self.pos:self.pos + self.length]
+
+  #Most recent sample of each channel
+  def latest(self):
+    return self.buf[:, self.pos + self.length - 1]
+
+  #Smallest value in whole history
+  def min(self):
+    return self.mins.min()
+
+  #Largest value in whole history
+  def max(self):
+    return self.maxs.max()
@@ -0,0 +1,230 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : sources.py
+   Description: Where displayed data comes from: live DSM buffers, generated
+                demo data or a recorded log. Every source fills a MonitorData
+                through acquire(data, timer) once per frame, so the renderer
+                does not care which one it is drawing from.
+---*-----------------------------------------------------------------------*'''
+import time
+import numpy as np
+from QuaternionFuncs import axisangle_to_q, q_mult
+from monitor.buffers import BufferPool, ageBuffers, storeBuffer
+from monitor.table import SERVER_IPS
+from monitor.timing import perfCounterNs
+
+CLOSE_TIMEOUT = 1.0 #Longest wait in seconds for the poll thread on close
+
+'''DemoSource------------------------------------------------------------------
+Generates fake data to display
+----------------------------------------------------------------------------'''
+class DemoSource(object):
+  def acquire(self, data, timer = None):
+    #Set all buffer strings to active
+    data.statusStrings[:] = 'Up  '
+
+    #Generate forward and downward computer vision data
+    for i in range(3):
+      data.cvforward[i][0] = np.random.randint(0, 3)
+      data.cvforward[i][1] = np.random.randint(0, 5)
+      data.cvforward[i][2] = np.random.randint(-10, 10)
+      data.cvforward[i][3] = np.random.randint(0, 255)
+      data.cvforward[i][4] = np.random.randint(0, 5)
+
+    data.cvdown[0] = np.random.randint(0, 3)
+    data.cvdown[1] = np.random.randint(0, 5)
+    data.cvdown[2] = np.random.randint(-10, 10)
+    data.cvdown[3] = np.random.randint(0, 255)
+    data.cvdown[4] = np.random.randint(0, 5)
+
+    #Generate sonar data
+    data.sonar[0] = np.random.randint(-5, 5)
+    data.sonar[1] = np.random.randint(-5, 5)
+    data.sonar[2] = np.random.randint(-10, 10)
+    data.sonar[3] = np.random.randint(0, 255)
+    data.sonar[4] = np.random.randint(0, 5)
+
+    #Generate 3 quaternions representing 3 rotations
+    q1 = axisangle_to_q((1, 0, 0), np.random.randint(0, 3) / 8)
+    q2 = axisangle_to_q((0, 1, 0), np.random.randint(0, 3) / 8)
+    q3 = axisangle_to_q((0, 1, 1), np.random.randint(0, 3) / 8)
+
+    #Multiply all 3 quaternions into one for a single rotation transformation
+    data.orientation[:] = q_mult(q_mult(q1, q2), q3)
+
+    #Generate thruster output data
+    for i in range(2):
+      for j in range(4):
+        data.thruster[i][j] = np.random.randint(0, 20) / 20
+
+    #Generate movement data
+    for i in range(3):
+      for j in range(3):
+        data.movement[i][j] += np.random.randint(-2, 2)
+
+    data.status[0] = 'Killed'
+
+  def close(self):
+    pass
+
+'''DsmSource-------------------------------------------------------------------
+Polls the buffers in table from a DSM client (pydsm.Client or a local DSM
+stand-in). Debug only buffers are decoded when debug is set, every poll is
+passed to recorder if given, and with a pollDelay (ms) buffers are polled on
+a background thread, starting from a copy of initial if given, instead of
+once per frame. With a deadline (ms) servers are fetched from concurrently,
+and buffers of servers that miss it are shown as late instead of waited for
+----------------------------------------------------------------------------'''
+class DsmSource(object):
+  def __init__(self, client, table, debug = False, pollDelay = 0,
+               recorder = None, deadline = 0, initial = None):
+    self.client   = client
+    self.table    = table
+    self.debug    = debug
+    self.recorder = recorder
+    self.poller   = None
+    self.fetcher  = None
+    self.errors   = {} #Server id -> last fetch error printed
+
+    print('[Info   ] Initializing DSM client/buffers')
+    for entry in table:
+      if entry.ip not in SERVER_IPS:
+        print('[Warning] Connecting to non-rasp pi IP')
+
+    #Initialize remote buffers
+    for entry in table:
+      client.registerRemoteBuffer(entry.name, entry.ip, int(entry.serverId))
+
+    #Allocate one struct per buffer, refilled in place every poll
+    pool = BufferPool()
+    for entry in table:
+      entry.bind(pool)
+
+    #Fetcher, poller and replay are only imported by the modes using them
+    if deadline > 0:
+      from monitor.fetcher import Fetcher
+      print('[Info   ] Fetching servers concurrently, {} ms deadline'.format(
+            deadline))
+      self.fetcher = Fetcher(client, table, deadline / 1000.0,
+                             self.reportError)
+
+    #Poll buffers on their own thread so drawing never waits on the network
+    if pollDelay > 0:
+      from monitor.poller import Poller
+      print('[Info   ] Polling buffers on background thread')
+      self.poller = Poller(self.poll, len(table), pollDelay / 1000.0,
+                           initial)
+      self.poller.start()
+
+  '''poll----------------------------------------------------------------------
+  Obtains most recent buffer data, charging fetching and decoding to timer if
+  given. Returns seconds until the next buffer is due
+  --------------------------------------------------------------------------'''
+  def poll(self, target, timer = None):
+    now = time.monotonic()
+    due = [i for i in range(len(self.table)) if self.table[i].due(now)]
+
+    #Check status of each buffer that is due
+    start = perfCounterNs()
+    if self.fetcher is not None:
+      results, late = self.fetcher.fetch(due)
+    else:
+      results = []
+      late    = []
+      failed  = set() #Servers whose fetch failed this poll
+      for i in due:
+        entry = self.table[i]
+        serverId = int(entry.serverId)
+        contents, active = b'', False
+        if serverId not in failed:
+          try:
+            contents, active = self.client.getRemoteBufferContents(
+                                 entry.name, entry.ip, entry.serverId)
+          except Exception as err:
+            #Show the rest of the server's buffers as down this poll
+            self.reportError(serverId, err)
+            failed.add(serverId)
+        results.append((i, now, contents, active))
+      for serverId in set(int(self.table[i].serverId) for i in due) - failed:
+        self.reportError(serverId, None)
+    if timer is not None:
+      timer.add('fetch', perfCounterNs() - start)
+
+    #Decode contents of each fetched buffer if active
+    for i, fetched, contents, active in results:
+      entry = self.table[i]
+      if self.recorder is not None:
+        self.recorder.record(entry.name, entry.serverId, fetched, active,
+                             contents)
+      if timer is not None:
+        start = perfCounterNs()
+        storeBuffer(self.table, i, contents, active, self.debug, target,
+                    fetched)
+        timer.add('decode', perfCounterNs() - start)
+      else:
+        storeBuffer(self.table, i, contents, active, self.debug, target,
+                    fetched)
+      entry.schedule(fetched, active)
+
+    #Late buffers keep their last values, and stay due until fetched
+    for i in late:
+      target.statusStrings[i] = 'Late'
+    now = time.monotonic()
+    ageBuffers(self.table, target, now)
+
+    #Seconds until the next buffer is due
+    nextPoll = min(entry.nextPoll for entry in self.table)
+    return nextPoll - now
+
+  #Print a server's fetch error unless it is the last one printed for it,
+  #err None when a fetch succeeds
+  def reportError(self, serverId, err):
+    if err is None:
+      self.errors.pop(serverId, None)
+    elif self.errors.get(serverId) != str(err):
+      self.errors[serverId] = str(err)
+      print('[Error  ] Fetch from server {} failed: {}'.format(serverId, err))
+
+  #Latest polled data, swapped in from the poll thread if there is one
+  def acquire(self, data, timer = None):
+    if self.poller is not None:
+      self.poller.swap(data, timer)
+    else:
+      self.poll(data, timer)
+
+  #Stop and briefly wait for the poll thread, then stop fetch workers. A poll
+  #stuck on a dead server is left behind, its daemon thread ends at exit
+  def close(self):
+    if self.poller is not None:
+      self.poller.stop()
+      if not self.poller.join(CLOSE_TIMEOUT):
+        print('[Warning] Poll thread still waiting on a server, leaving it')
+      self.poller = None
+    if self.fetcher is not None:
+      self.fetcher.close()
+      self.fetcher = None
+
+'''ReplaySource----------------------------------------------------------------
+Plays a LogReader's log back through the same decoding as polling, in log
+time, starting seekTime s into the log
+----------------------------------------------------------------------------'''
+class ReplaySource(object):
+  def __init__(self, reader, table, speed = 1.0, step = 1.0, debug = False,
+               seekTime = 0.0):
+    from monitor.replay import Replayer
+    self.reader = reader
+
+    #Allocate one struct per buffer, refilled in place every record
+    pool = BufferPool()
+    for entry in table:
+      entry.bind(pool)
+
+    self.replayer = Replayer(reader, table, speed, step, debug)
+    self.replayer.seek(reader.start + seekTime)
+
+  def acquire(self, data, timer = None):
+    self.replayer.poll(data)
+
+  def close(self):
+    self.reader.close()
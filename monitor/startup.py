@@ -0,0 +1,42 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : startup.py
+   Description: Times each step of startup, with how many modules the step
+                imported, so a slow start can be traced to the step (and
+                usually the import) responsible. Only uses the standard
+                library so timing starts before numpy or matplotlib load.
+---*-----------------------------------------------------------------------*'''
+import sys, time
+
+'''StartupTimer----------------------------------------------------------------
+Call mark(step) as each step of startup finishes, summary() when done
+----------------------------------------------------------------------------'''
+class StartupTimer(object):
+  def __init__(self):
+    self.begin   = self.last = time.perf_counter()
+    self.modules = len(sys.modules) #Modules loaded when last step ended
+    self.steps   = [] #(step, seconds, modules imported)
+
+  #Charge time and imports since last mark to step
+  def mark(self, step):
+    now = time.perf_counter()
+    self.steps.append((step, now - self.last,
+                       len(sys.modules) - self.modules))
+    self.last    = now
+    self.modules = len(sys.modules)
+
+  #Seconds from start to the last step
+  def total(self):
+    return self.last - self.begin
+
+  #Table of steps for display
+  def summary(self):
+    lines = ['STARTUP------------------------ms--imports']
+    for step, seconds, modules in self.steps:
+      lines.append('{:<20}:{:>12.1f}{:>9}'.format(step, seconds * 1000,
+                                                  modules))
+    lines.append('{:<20}:{:>12.1f}{:>9}'.format('Total', self.total() * 1000,
+                                                sum(step[2] for step in
+                                                    self.steps)))
+    return '\n'.join(lines)
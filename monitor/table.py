@@ -0,0 +1,88 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : table.py
+   Description: The DSM buffers the monitor polls, where they live, how often
+                to poll them and how to decode them, in status panel order.
+---*-----------------------------------------------------------------------*'''
+from Constants import *
+from Master import *
+from Navigation import *
+from Sensor import *
+from Vision import *
+from monitor.buffers import BufferEntry
+from monitor.decoders import *
+
+#DSM Constants
+CLIENT_SERV  = SONAR_SERVER_ID #Server id to connect to
+CLIENT_ID    = 60              #Client id to register to server
+
+#IPs of the robot's servers, anything else is probably a test machine
+SERVER_IPS = [MASTER_SERVER_IP, SENSOR_SERVER_IP, MOTOR_SERVER_IP,
+              FORWARD_VISION_SERVER_IP, DOWNWARD_VISION_SERVER_IP,
+              SONAR_SERVER_IP]
+
+#DSM Poll Intervals (ms), inactive buffers back off up to POLL_BACKOFF
+POLL_FAST    = 50                #Buffers that change at IMU rate
+POLL_NORMAL  = 100               #Buffers that change every control loop
+POLL_SLOW    = 500               #Buffers that rarely change
+POLL_BACKOFF = 2000              #Longest delay between polls of a down buffer
+
+'''makeBufferTable-------------------------------------------------------------
+New buffer table, one entry per polled buffer, in status panel order. Entries
+keep their own poll schedule, so every user gets its own table
+  BufferEntry(label, name, server ip, server id, struct, decoder,
+              debugOnly, poll interval, backoff limit, panel)
+Buffers with no panel are polled for the status panel but not decoded
+----------------------------------------------------------------------------'''
+def makeBufferTable():
+  return [
+  BufferEntry('Motor  Kill',    MOTOR_KILL,          MOTOR_SERVER_IP,
+              MOTOR_SERVER_ID,          Kill,           decodeKill,
+              False, POLL_SLOW,   POLL_BACKOFF, 'status'),
+  BufferEntry('Motor  Health',  MOTOR_HEALTH,        MOTOR_SERVER_IP,
+              MOTOR_SERVER_ID,          Health,         decodeHealth,
+              False, POLL_SLOW,   POLL_BACKOFF, 'status'),
+  BufferEntry('Motor  Outputs', MOTOR_OUTPUTS,       MOTOR_SERVER_IP,
+              MOTOR_SERVER_ID,          Outputs,        decodeOutputs,
+              False, POLL_NORMAL, POLL_BACKOFF, 'heatmap'),
+  BufferEntry('Motor  Lin',     SENSORS_LINEAR,      MOTOR_SERVER_IP,
+              MOTOR_SERVER_ID,          PhysicalOutput, decodeMotorLinear,
+              False, POLL_NORMAL, POLL_BACKOFF, 'status'),
+  BufferEntry('Motor  Ang',     SENSORS_ANGULAR,     MOTOR_SERVER_IP,
+              MOTOR_SERVER_ID,          PhysicalOutput, decodeMotorAngular,
+              False, POLL_NORMAL, POLL_BACKOFF, 'status'),
+  BufferEntry('Sensor Lin',     SENSORS_LINEAR,      SENSOR_SERVER_IP,
+              SENSOR_SERVER_ID,         Linear,         decodeSensorsLinear,
+              False, POLL_FAST,   POLL_BACKOFF, 'movement'),
+  BufferEntry('Sensor Ang',     SENSORS_ANGULAR,     SENSOR_SERVER_IP,
+              SENSOR_SERVER_ID,         Angular,        decodeSensorsAngular,
+              False, POLL_FAST,   POLL_BACKOFF, 'orientation'),
+  BufferEntry('Sensor Data',    SENSORS_DATA,        SENSOR_SERVER_IP,
+              SENSOR_SERVER_ID,         Data,           None,
+              True,  POLL_NORMAL, POLL_BACKOFF, None),
+  BufferEntry('Master Control', MASTER_CONTROL,      MASTER_SERVER_IP,
+              MASTER_SERVER_ID,         ControlInput,   decodeMasterControl,
+              True,  POLL_NORMAL, POLL_BACKOFF, 'status'),
+  BufferEntry('Master Goals',   MASTER_GOALS,        MASTER_SERVER_IP,
+              MASTER_SERVER_ID,         Goals,          None,
+              True,  POLL_SLOW,   POLL_BACKOFF, None),
+  BufferEntry('Master SensRes', MASTER_SENSOR_RESET, MASTER_SERVER_IP,
+              MASTER_SERVER_ID,         SensorReset,    None,
+              True,  POLL_SLOW,   POLL_BACKOFF, None),
+  BufferEntry('CVForw Target',  TARGET_LOCATION,     FORWARD_VISION_SERVER_IP,
+              FORWARD_VISION_SERVER_ID, LocationArray,  decodeCVForward,
+              False, POLL_NORMAL, POLL_BACKOFF, 'polar'),
+  BufferEntry('CVDown Target',  TARGET_LOCATION,     DOWNWARD_VISION_SERVER_IP,
+              DOWNWARD_VISION_SERVER_ID, Location,      decodeCVDown,
+              False, POLL_NORMAL, POLL_BACKOFF, 'polar'),
+  BufferEntry('Sonar  Target',  TARGET_LOCATION,     SONAR_SERVER_IP,
+              SONAR_SERVER_ID,          Location,       decodeSonar,
+              False, POLL_NORMAL, POLL_BACKOFF, 'polar')]
+
+#Row of the first buffer in table whose data panel displays, None if none
+def panelRow(table, panel):
+  for i in range(len(table)):
+    if table[i].panel == panel:
+      return i
+  return None
@@ -0,0 +1,117 @@
+'''*-----------------------------------------------------------------------*---
+                                                         Author: Jason Ma
+                                                         Date  : Oct 16 2026
+   File Name  : timing.py
+   Description: Per-stage frame timing. Each frame is split into named stages
+                timed with perf_counter_ns, the last window frames are kept
+                for rolling p50/p99 and achieved FPS, and every frame can be
+                dumped to CSV for offline tuning.
+---*-----------------------------------------------------------------------*'''
+import csv, time
+import numpy as np
+
+#Nanosecond clock, perf_counter_ns needs Python 3.7
+try:
+  perfCounterNs = time.perf_counter_ns
+except AttributeError:
+  perfCounterNs = lambda: int(time.perf_counter() * 1e9)
+
+'''FrameTimer------------------------------------------------------------------
+Times stages of each frame. Call start(), mark(stage) as each stage finishes
+and end() once the frame is done. Stages may also be timed from inside
+another stage with add(), which is taken back out of the enclosing stage, or
+on another thread with note(), which is not part of the frame's total
+----------------------------------------------------------------------------'''
+class FrameTimer(object):
+  def __init__(self, stages, window = 100, csvPath = None):
+    self.stages  = list(stages)
+    self.index   = dict((stages[j], j) for j in range(len(stages)))
+    self.window  = window
+    self.times   = np.zeros((len(stages) + 1, window), np.int64) #ns, + total
+    self.ends    = np.zeros(window, np.int64) #When each frame ended
+    self.current = np.zeros(len(stages), np.int64)
+    self.count   = 0 #Frames ended
+    self.last    = 0 #When last stage ended
+    self.begin   = 0 #When current frame started
+    self.added   = 0 #ns added to stages since last mark
+    self.shown   = None #When summary was last displayed
+
+    self.csvFile = None
+    if csvPath is not None:
+      self.csvFile = open(csvPath, 'w')
+      self.csv = csv.writer(self.csvFile)
+      self.csv.writerow(['frame', 'end_ns'] + self.stages + ['total'])
+
+  def start(self):
+    self.current[:] = 0
+    self.added = 0
+    self.begin = self.last = perfCounterNs()
+
+  #Charge time since last mark to stage
+  def mark(self, stage):
+    now = perfCounterNs()
+    self.current[self.index[stage]] += now - self.last - self.added
+    self.added = 0
+    self.last  = now
+
+  #Charge ns measured elsewhere to stage instead of the stage running now
+  def add(self, stage, ns):
+    self.current[self.index[stage]] += ns
+    self.added += ns
+
+  #Charge ns spent on another thread for this frame to stage
+  def note(self, stage, ns):
+    self.current[self.index[stage]] += ns
+
+  def end(self):
+    now = perfCounterNs()
+    pos = self.count % self.window
+    self.times[:-1, pos] = self.current
+    self.times[-1, pos]  = now - self.begin
+    self.ends[pos] = now
+    self.count += 1
+
+    if self.csvFile is not None:
+      self.csv.writerow([self.count, now] + self.current.tolist() +
+                        [now - self.begin])
+
+  #Rolling (p50, p99) in ms of each stage then the whole frame
+  def percentiles(self):
+    frames = min(self.count, self.window)
+    if frames == 0:
+      return np.zeros((len(self.stages) + 1, 2))
+    return np.percentile(self.times[:, :frames], (50, 99), axis = 1).T / 1e6
+
+  #Frames per second over the window
+  def fps(self):
+    frames = min(self.count, self.window)
+    if frames < 2:
+      return 0.0
+    newest = self.ends[(self.count - 1) % self.window]
+    oldest = self.ends[self.count % self.window] if self.count > self.window \
+             else self.ends[0]
+    return (frames - 1) / ((newest - oldest) / 1e9)
+
+  #Whether the summary is due to be displayed again, at most every interval s
+  def due(self, interval):
+    now = time.monotonic()
+    if self.shown is not None and now - self.shown < interval:
+      return False
+    self.shown = now
+    return True
+
+  #Table of rolling stats for display
+  def summary(self):
+    lines = ['FRAME TIMING-------------p50 ms---p99 ms']
+    names = [stage.capitalize() for stage in self.stages] + ['Total']
+    stats = self.percentiles()
+    for j in range(len(names)):
+      lines.append('{:<14}:{:>16.2f}{:>9.2f}'.format(names[j], stats[j][0],
+                                                     stats[j][1]))
+    lines.append('FPS           :{:>16.2f}'.format(self.fps()))
+    return '\n'.join(lines)
+
+  def close(self):
+    if self.csvFile is not None:
+      self.csvFile.close()
+      self.csvFile = None